@@ -0,0 +1,115 @@
+import tkinter as tk
+from tkinter import font as tkfont
+from paging import BlockPager, TextChunks
+
+class BlockViewer(tk.Frame):
+    """
+    Virtualised viewer for ciphertext blocks or plaintext: the text widget only ever holds
+    the visible page, the scrollbar is driven by the block index instead of the widget contents.
+    """
+    def __init__(self, master, bg: str, fg: str, text_font=("Consolas", 10), rows: int = 6, formats: bool = True):
+        super().__init__(master, bg=bg)
+        self.pager = BlockPager(rows)
+        self.line_height = tkfont.Font(font=text_font).metrics("linespace")
+
+        # toolbar: format toggle, jump to block, position
+        toolbar = tk.Frame(self, bg=bg)
+        toolbar.pack(fill="x")
+
+        self.fmt = tk.StringVar(value="dec")
+        if formats:
+            for label, value in (("Dec", "dec"), ("Hex", "hex")):
+                tk.Radiobutton(toolbar, text=label, value=value, variable=self.fmt, command=self._on_format,
+                               bg=bg, fg=fg, selectcolor=bg, activebackground=bg).pack(side=tk.LEFT)
+
+        tk.Label(toolbar, text="Go to block:", bg=bg, fg=fg).pack(side=tk.LEFT, padx=(10, 2))
+        self.jump_entry = tk.Entry(toolbar, width=10)
+        self.jump_entry.pack(side=tk.LEFT)
+        self.jump_entry.bind("<Return>", lambda event: self._on_jump())
+        tk.Button(toolbar, text="Go", command=self._on_jump).pack(side=tk.LEFT, padx=2)
+
+        self.position = tk.StringVar()
+        tk.Label(toolbar, textvariable=self.position, bg=bg, fg=fg).pack(side=tk.RIGHT)
+
+        # page
+        body = tk.Frame(self, bg=bg)
+        body.pack(fill="both", expand=True)
+
+        self.scrollbar = tk.Scrollbar(body, orient=tk.VERTICAL, command=self._on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill="y")
+
+        self.text = tk.Text(body, height=rows, wrap="none", font=text_font, bg="#34495E", fg=fg,
+                            relief="sunken", bd=1, state=tk.DISABLED)
+        self.text.pack(side=tk.LEFT, fill="both", expand=True)
+
+        self.text.bind("<Configure>", self._on_resize)
+        self.text.bind("<MouseWheel>", lambda event: self._scroll(-1 if event.delta > 0 else 1))
+        self.text.bind("<Button-4>", lambda event: self._scroll(-1))
+        self.text.bind("<Button-5>", lambda event: self._scroll(1))
+
+        self._render()
+
+    # --- content ---
+
+    def set_blocks(self, blocks: list[int], width: int = 0):
+        """Shows ciphertext/plaintext blocks, width (bytes) is used to zero-pad hex blocks."""
+        self.pager.set_items(blocks, width)
+        self._render()
+
+    def set_text(self, text: str, chunk_size: int = 64):
+        """Shows a long text, chunk_size characters per row."""
+        self.pager.set_items(TextChunks(text, chunk_size))
+        self._render()
+
+    def clear(self):
+        self.pager.set_items([])
+        self._render()
+
+    # --- events ---
+
+    def _render(self):
+        self.text.config(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", "\n".join(self.pager.visible_rows()))
+        self.text.config(state=tk.DISABLED)
+
+        self.scrollbar.set(*self.pager.fractions())
+
+        total = len(self.pager.items)
+        if total:
+            last = min(self.pager.first + self.pager.page_size, total)
+            self.position.set(f"{self.pager.first}-{last - 1} of {total}")
+        else:
+            self.position.set("")
+
+    def _scroll(self, rows: int):
+        self.pager.scroll(rows)
+        self._render()
+
+    def _on_scroll(self, action, amount, unit=None):
+        # scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+        if action == "moveto":
+            self.pager.moveto(float(amount))
+        elif unit == "pages":
+            self.pager.scroll(int(amount) * self.pager.page_size)
+        else:
+            self.pager.scroll(int(amount))
+        self._render()
+
+    def _on_resize(self, event):
+        rows = max(1, event.height // self.line_height)
+        if rows != self.pager.page_size:
+            self.pager.set_page_size(rows)
+            self._render()
+
+    def _on_format(self):
+        self.pager.fmt = self.fmt.get()
+        self._render()
+
+    def _on_jump(self):
+        try:
+            i = int(self.jump_entry.get())
+        except ValueError:
+            return
+        self.pager.goto(i)
+        self._render()
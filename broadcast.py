@@ -0,0 +1,115 @@
+from concurrent.futures import ProcessPoolExecutor
+import random
+import rsa_core
+import ecb
+import cbc
+
+# Encrypting one message for many recipients (public keys).
+# The text is encoded, compressed and padded once per distinct block size, instead of once per recipient,
+# and the modexp work for all recipients is spread over a process pool.
+
+# padded blocks of the message by block size, set in every worker process by _init_worker()
+_shared_blocks = {}
+
+def default_block_size(n: int) -> int:
+    """
+    :param n: RSA modulus.
+    :type n: int
+    :return: Largest block size (in bytes) that is valid for the modulus.
+    :rtype: int
+    """
+    # the padding length is stored in one byte, see rsa_core.pad_message()
+    return min((n.bit_length() - 1) // 8, 255)
+
+
+def prepare_blocks(text: str, block_sizes: set[int], compression: str | None = None) -> dict[int, list[int]]:
+    """
+    Encodes (and optionally compresses) the text once, then pads and blocks it for every block size.
+
+    :param text: Text to be encrypted.
+    :type text: str
+    :param block_sizes: Block sizes (in bytes) needed by the recipients.
+    :type block_sizes: set[int]
+    :param compression: Compression method applied before padding (optional), see rsa_core.compress_message().
+    :type compression: str | None
+    :return: Message blocks for every block size.
+    :rtype: dict[int, list[int]]
+    """
+    message = text.encode("utf-8")
+    if compression is not None:
+        message = rsa_core.compress_message(message, compression)
+
+    blocks_by_size = {}
+    for block_size in sorted(block_sizes):
+        padded = rsa_core.pad_message(message, block_size)
+        blocks_by_size[block_size] = [
+            int.from_bytes(padded[i: i+block_size], byteorder="big") for i in range(0, len(padded), block_size)
+        ]
+        print(f"[BROADCAST] {len(blocks_by_size[block_size])} blocks of {block_size} bytes")
+
+    return blocks_by_size
+
+
+def _init_worker(blocks_by_size: dict[int, list[int]]):
+    # the message blocks are sent once per worker process, not once per recipient
+    global _shared_blocks
+    _shared_blocks = blocks_by_size
+
+
+def _encrypt_for(task: tuple[int, int, int | None, int]) -> list[int]:
+    # no per-block logging, ECB mode or, if iv is given, CBC mode
+    e, n, iv, block_size = task
+    if iv is None:
+        return ecb.modexp_blocks(_shared_blocks[block_size], e, n)
+    return cbc.encrypt_blocks(_shared_blocks[block_size], e, n, iv, block_size)
+
+
+def encrypt_for_recipients(text: str, recipients: list[tuple[int, int]], mode: str = "ECB",
+                           block_size: int | None = None, compression: str | None = None,
+                           workers: int | None = None, rng: random.Random | None = None) -> list:
+    """
+    Encrypts the same text for every recipient in one pass.\n
+    Every recipient gets the same result ecb.encrypt_text() / cbc.encrypt_text() would give them
+    (CBC with its own random IV), and decrypts it with ecb.decrypt_text() / cbc.decrypt_text().
+
+    :param text: Text to be encrypted.
+    :type text: str
+    :param recipients: Public key and RSA modulus (e, n) of every recipient.
+    :type recipients: list[tuple[int, int]]
+    :param mode: "ECB" or "CBC".
+    :type mode: str
+    :param block_size: Block size (in bytes) for all recipients, by default the largest one valid for each modulus.
+    :type block_size: int | None
+    :param compression: Compression method applied before padding (optional), see rsa_core.compress_message().
+    :type compression: str | None
+    :param workers: Number of worker processes (default: number of CPUs), 1 encrypts in-process.
+    :type workers: int | None
+    :param rng: Seeded randomness source for reproducible IVs (optional), see cbc.generate_iv().
+    :type rng: random.Random | None
+    :return: Encrypted blocks (ECB) or IV and encrypted blocks (CBC) for every recipient, in order.
+    :rtype: list[list[int]] | list[tuple[int, list[int]]]
+    """
+    if mode not in ("ECB", "CBC"):
+        raise ValueError(f"Unknown mode: {mode}")
+
+    tasks = []
+    for e, n in recipients:
+        size = block_size if block_size is not None else default_block_size(n)
+        rsa_core.validate_block_size(size, n)
+        iv = cbc.generate_iv(size, rng) if mode == "CBC" else None
+        tasks.append((e, n, iv, size))
+
+    blocks_by_size = prepare_blocks(text, {task[3] for task in tasks}, compression)
+    print(f"[BROADCAST] encrypting for {len(tasks)} recipients in {mode} mode")
+
+    if workers == 1 or len(tasks) <= 1:
+        _init_worker(blocks_by_size)
+        results = [_encrypt_for(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(blocks_by_size,)) as pool:
+            results = list(pool.map(_encrypt_for, tasks))
+
+    print("[BROADCAST] encryption complete\n")
+    if mode == "CBC":
+        return [(task[2], encrypted_blocks) for task, encrypted_blocks in zip(tasks, results)]
+    return results
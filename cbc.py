@@ -1,19 +1,22 @@
 import random 
 import rsa_core
+import ecb
 
 # NOTE RSA is not a block cipher and CBC mode is not used in real-world cryptosystems.
 
 # ENCRYPTING THE DATA IN CBC MODE
-def generate_iv(block_size: int) -> int:
+def generate_iv(block_size: int, rng: random.Random | None = None) -> int:
     """
     :param block_size: Block size in bytes.
     :type block_size: int
+    :param rng: Seeded randomness source for reproducible IVs (optional), the global random module by default.
+    :type rng: random.Random | None
     :return: Initialisation vector "iv" used as c_0 in cipher-block chaining.
     :rtype: int
     """
     min_val = 0
     max_val = 2 ** (block_size * 8) - 1
-    iv = random.randint(min_val, max_val)
+    iv = (rng or random).randint(min_val, max_val)
     print(f"[CBC] Generated IV = {iv}")
 
     return iv
@@ -74,7 +77,7 @@ def rsa_cbc_encrypt(blocks: list[int], e: int, n: int, iv: int, block_size: int)
     return encrypted_blocks
 
 
-def rsa_cbc_decrypt(encrypted_blocks: list[int], d: int, n: int, iv: int, block_size: int) -> list[int]:
+def rsa_cbc_decrypt(encrypted_blocks: list[int], d: int, n: int, iv: int, block_size: int, crt: list[tuple[int, int, int]] | None = None) -> list[int]:
     """
     Decrypts a list of blocks (integers) using RSA encryption in CBC mode. 
     
@@ -88,6 +91,8 @@ def rsa_cbc_decrypt(encrypted_blocks: list[int], d: int, n: int, iv: int, block_
     :type iv: int
     :param block_size: Size of blocks (in bytes).
     :type block_size: int
+    :param crt: CRT components of the private key (optional), see rsa_core.keygen_crt().
+    :type crt: list[tuple[int, int, int]] | None
     :return: Decrypted blocks.
     :rtype: list[int]
     """
@@ -103,7 +108,7 @@ def rsa_cbc_decrypt(encrypted_blocks: list[int], d: int, n: int, iv: int, block_
         print(f"\n[CBC-DECRYPT] Encrypted block = {encrypted_block}")
         print(f"[CBC-DECRYPT] Previous cipher (prev) = {prev}")
 
-        mixed = rsa_core.rsa_decrypt_block(encrypted_block, d, n)
+        mixed = rsa_core.rsa_decrypt_block(encrypted_block, d, n, crt)
         print(f"[CBC-DECRYPT] Decrypted mixed value = {mixed}")
 
         mixed &= mask
@@ -119,7 +124,40 @@ def rsa_cbc_decrypt(encrypted_blocks: list[int], d: int, n: int, iv: int, block_
     return blocks
 
 
-def encrypt_text(text: str, e: int, n: int, block_size: int) -> tuple[int, list[int]]:
+def encrypt_blocks(blocks: list[int], e: int, n: int, iv: int, block_size: int) -> list[int]:
+    """
+    Same as rsa_cbc_encrypt(), without any logging.\n
+    Used by the backends (broadcast) that encrypt many messages at once.
+    """
+    mask = (1 << (block_size * 8)) - 1
+    prev = iv & mask
+    encrypted_blocks = []
+    for block in blocks:
+        c = pow(block ^ prev, e, n)
+        encrypted_blocks.append(c)
+        prev = c & mask
+
+    return encrypted_blocks
+
+
+def decrypt_blocks(encrypted_blocks: list[int], d: int, n: int, prev: int, block_size: int,
+                   crt: list[tuple[int, int, int]] | None = None) -> list[int]:
+    """
+    Same as rsa_cbc_decrypt(), without any logging.\n
+    Every block only needs the ciphertext block before it, so the backends (shared_pool, distributed)
+    decrypt a run of blocks independently: prev is the ciphertext block before the run (the IV for the first run).
+    """
+    mask = (1 << (block_size * 8)) - 1
+    blocks = []
+    for c, m in zip(encrypted_blocks, ecb.modexp_blocks(encrypted_blocks, d, n, crt)):
+        blocks.append((m & mask) ^ (prev & mask))
+        prev = c
+
+    return blocks
+
+
+def encrypt_text(text: str, e: int, n: int, block_size: int, compression: str | None = None,
+                 rng: random.Random | None = None) -> tuple[int, list[int]]:
     """
     Encrypts a given text using RSA encryption in CBC mode.
     
@@ -131,18 +169,22 @@ def encrypt_text(text: str, e: int, n: int, block_size: int) -> tuple[int, list[
     :type n: int
     :param block_size: Size of blocks (in bytes).
     :type block_size: int
+    :param compression: Compression method applied before padding (optional), see rsa_core.compress_message().
+    :type compression: str | None
+    :param rng: Seeded randomness source for the IV (optional), see generate_iv().
+    :type rng: random.Random | None
     :return: Initialization vector and encrypted blocks.
     :rtype: tuple[int, list[int]]
     """
     rsa_core.validate_block_size(block_size, n)
-    blocks = rsa_core.string_to_blocks(text, block_size)
-    iv = generate_iv(block_size)
+    blocks = rsa_core.string_to_blocks(text, block_size, compression)
+    iv = generate_iv(block_size, rng)
 
     encrypted_blocks = rsa_cbc_encrypt(blocks, e, n, iv, block_size)
     return iv, encrypted_blocks
 
 
-def decrypt_text(encrypted_blocks: list[int], d: int, n: int, iv: int, block_size: int) -> str:
+def decrypt_text(encrypted_blocks: list[int], d: int, n: int, iv: int, block_size: int, crt: list[tuple[int, int, int]] | None = None) -> str:
     """
     Decrypts encrypted blocks using RSA encryption in CBC mode back into text.
     
@@ -156,8 +198,10 @@ def decrypt_text(encrypted_blocks: list[int], d: int, n: int, iv: int, block_siz
     :type iv: int
     :param block_size: Size of blocks (in bytes).
     :type block_size: int
+    :param crt: CRT components of the private key (optional), see rsa_core.keygen_crt().
+    :type crt: list[tuple[int, int, int]] | None
     :return: Decrypted text.
     :rtype: str
     """
-    blocks = rsa_cbc_decrypt(encrypted_blocks, d, n, iv, block_size)
+    blocks = rsa_cbc_decrypt(encrypted_blocks, d, n, iv, block_size, crt)
     return rsa_core.blocks_to_string(blocks, block_size)
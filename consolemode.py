@@ -1,6 +1,5 @@
 import rsa_core
-import ecb
-import cbc
+import transport
 
 def main():
     print("=== RSA Encryption Console Mode ===\n")
@@ -32,16 +31,18 @@ def main():
     
     print(f"\nOriginal message: {message}")
     
+    # only the selected mode module is imported
     if mode == "ECB":
+        import ecb
         encrypted_blocks = ecb.encrypt_text(message, e, n, block_size)
-        print(f"\nEncrypted blocks: {encrypted_blocks}")
+        print(f"\nCiphertext: {transport.encode(encrypted_blocks, n, mode, block_size)}")
         
         #Decrypt
         decrypted_message = ecb.decrypt_text(encrypted_blocks, d, n, block_size)
     else:  
+        import cbc
         iv, encrypted_blocks = cbc.encrypt_text(message, e, n, block_size)
-        print(f"\nIV: {iv}")
-        print(f"Encrypted blocks: {encrypted_blocks}")
+        print(f"\nCiphertext: {transport.encode(encrypted_blocks, n, mode, block_size, iv)}")
         
         #Decrypt
         decrypted_message = cbc.decrypt_text(encrypted_blocks, d, n, iv, block_size)
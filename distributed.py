@@ -0,0 +1,404 @@
+from collections import deque
+from multiprocessing import AuthenticationError, Process, Queue
+from multiprocessing.connection import Connection, Listener, answer_challenge, deliver_challenge
+import os
+import socket
+import sys
+import threading
+import time
+import ecb
+import cbc
+
+# Sharded block processing over TCP.
+# A coordinator splits the blocks into shards (index ranges) and hands them to worker processes,
+# which can run on other machines. Workers hold the key context for the whole run.
+#
+# Protocol (pickled tuples over an authenticated multiprocessing.connection):
+#   coordinator -> worker: ("key", exponent, n, crt, mask)    worker -> coordinator: ("ok",)
+#   coordinator -> worker: ("shard", shard_id, values, prev)  worker -> coordinator: ("result", shard_id, results)
+#                                                                                or ("error", shard_id, message)
+#   coordinator -> worker: ("close",)
+# If mask is set the shard is CBC ciphertext, prev is the ciphertext block before the shard (or the IV).
+
+# WORKER
+def _process_shard(values: list[int], prev: int | None, exponent: int, n: int,
+                   crt: list[tuple[int, int, int]] | None, mask: int | None) -> list[int]:
+    """
+    Raises every value to the exponent (or decrypts it with the CRT components),
+    and unchains the results if the shard is CBC ciphertext.
+    """
+    if mask is None:
+        return ecb.modexp_blocks(values, exponent, n, crt)
+    return cbc.decrypt_blocks(values, exponent, n, prev, mask.bit_length() // 8, crt)
+
+
+def _serve_connection(conn, delay: float = 0.0):
+    """
+    Answers the requests of a single coordinator until it closes the connection.\n
+    A coordinator that goes away mid-shard (reset connection, broken pipe) only ends this connection,
+    the worker goes back to accepting new ones.
+    """
+    context = None
+    try:
+        while True:
+            message = conn.recv()
+
+            if message[0] == "key":
+                context = message[1:]
+                conn.send(("ok",))
+
+            elif message[0] == "shard":
+                _, shard_id, values, prev = message
+                if delay:
+                    time.sleep(delay)
+
+                try:
+                    if context is None:
+                        raise ValueError("No key context received")
+                    exponent, n, crt, mask = context
+                    reply = ("result", shard_id, _process_shard(values, prev, exponent, n, crt, mask))
+                except Exception as ex:
+                    reply = ("error", shard_id, str(ex))
+                conn.send(reply)
+
+            elif message[0] == "close":
+                return
+
+    except EOFError:
+        return
+    except OSError as ex:
+        print(f"[WORKER] lost coordinator: {ex!r}")
+
+
+def _serve_and_close(conn, delay: float = 0.0):
+    try:
+        with conn:
+            _serve_connection(conn, delay)
+    except OSError as ex:
+        # closing an already reset connection
+        print(f"[WORKER] error closing connection: {ex!r}")
+
+
+def serve_worker(address: tuple[str, int], authkey: bytes, ready=None, delay: float = 0.0):
+    """
+    Runs a worker: listens on the address and serves coordinators, forever.\n
+    Every coordinator is served in its own thread, so a coordinator that is still waiting for a shard
+    (or has given up on it) does not block the next one.
+
+    :param address: (host, port) to listen on, port 0 picks a free port.
+    :type address: tuple[str, int]
+    :param authkey: Shared secret, coordinators with a different key are rejected.
+    :type authkey: bytes
+    :param ready: Queue the bound address is put into once the worker is listening (optional).
+    :type ready: multiprocessing.Queue | None
+    :param delay: Artificial delay per shard in seconds, to simulate a slow machine in tests.
+    :type delay: float
+    """
+    with Listener(address, authkey=authkey) as listener:
+        print(f"[WORKER] listening on {listener.address}")
+        if ready is not None:
+            ready.put(listener.address)
+
+        while True:
+            try:
+                conn = listener.accept()
+            except OSError as ex:
+                # includes failed authentication
+                print(f"[WORKER] rejected connection: {ex}")
+                continue
+
+            threading.Thread(target=_serve_and_close, args=(conn, delay), daemon=True).start()
+
+
+def start_local_workers(count: int, authkey: bytes, delay: float = 0.0) -> list[tuple[Process, tuple[str, int]]]:
+    """
+    Starts worker processes on localhost, mainly for testing.
+
+    :param count: Number of workers.
+    :type count: int
+    :param authkey: Shared secret.
+    :type authkey: bytes
+    :param delay: Artificial delay per shard in seconds (see serve_worker()).
+    :type delay: float
+    :return: Worker processes and their addresses, terminate the processes when done.
+    :rtype: list[tuple[Process, tuple[str, int]]]
+    """
+    workers = []
+    for _ in range(count):
+        ready = Queue()
+        process = Process(target=serve_worker, args=(("localhost", 0), authkey, ready, delay), daemon=True)
+        process.start()
+        workers.append((process, ready.get(timeout=10)))
+
+    return workers
+
+# COORDINATOR
+def _connect(address: tuple[str, int], authkey: bytes, timeout: float | None) -> Connection:
+    """
+    Same as multiprocessing.connection.Client(), but gives up on a worker that does not accept
+    the connection or answer the authentication handshake within the timeout.
+    """
+    with socket.create_connection(address, timeout=timeout) as s:
+        s.setblocking(True)
+        conn = Connection(s.detach())
+
+    try:
+        # the worker only starts the handshake once it has accepted the connection
+        if not conn.poll(timeout):
+            raise TimeoutError("worker did not accept the connection in time")
+        answer_challenge(conn, authkey)
+        deliver_challenge(conn, authkey)
+    except BaseException:
+        conn.close()
+        raise
+
+    return conn
+
+
+def run_sharded(addresses: list[tuple[str, int]], values: list[int], exponent: int, n: int, authkey: bytes,
+                crt: list[tuple[int, int, int]] | None = None, iv: int | None = None, mask: int | None = None,
+                shard_size: int = 256, straggler_timeout: float | None = 5.0,
+                worker_timeout: float | None = 60.0) -> list[int]:
+    """
+    Splits the values into shards, processes them on the workers and reassembles the results in order.\n
+    Workers pull the next shard when they finish one, so faster workers get more shards.
+    If a worker dies its shards go back into the queue. Once the queue is empty, idle workers
+    also take over shards that have been running for longer than straggler_timeout
+    (the first result to arrive is used).
+    Every worker is connected to in its own thread, a worker that does not connect or answer
+    within worker_timeout is treated as dead.
+
+    :param addresses: (host, port) of every worker.
+    :type addresses: list[tuple[str, int]]
+    :param values: Blocks to be processed.
+    :type values: list[int]
+    :param exponent: Public or private key.
+    :type exponent: int
+    :param n: RSA modulus.
+    :type n: int
+    :param authkey: Shared secret of the workers.
+    :type authkey: bytes
+    :param crt: CRT components of the private key (optional), see rsa_core.keygen_crt().
+    :type crt: list[tuple[int, int, int]] | None
+    :param iv: Initialisation vector, only for CBC decryption.
+    :type iv: int | None
+    :param mask: Block mask, only for CBC decryption.
+    :type mask: int | None
+    :param shard_size: Number of blocks in a shard.
+    :type shard_size: int
+    :param straggler_timeout: Seconds after which an idle worker takes over a running shard (None disables it).
+    :type straggler_timeout: float | None
+    :param worker_timeout: Seconds to wait for a worker to connect or to return a shard (None waits forever).
+    :type worker_timeout: float | None
+    :return: Results, in the same order as values.
+    :rtype: list[int]
+    """
+    assert shard_size >= 1
+
+    shards = [(start, min(start + shard_size, len(values))) for start in range(0, len(values), shard_size)]
+    if not shards:
+        return []
+
+    results = [None] * len(shards)
+    pending = deque(range(len(shards)))
+    running = {}  # shard_id -> [start time, set of worker names]
+    state = {"done": 0, "alive": 0, "error": None}
+    cond = threading.Condition()
+
+    def finished() -> bool:
+        return state["done"] == len(shards) or state["error"] is not None
+
+    def next_shard(name: str) -> int | None:
+        # called with cond held, blocks until there is work or the run is over
+        while not finished():
+            if pending:
+                shard_id = pending.popleft()
+                running[shard_id] = [time.monotonic(), {name}]
+                return shard_id
+
+            if straggler_timeout is not None:
+                now = time.monotonic()
+                for shard_id, (started, owners) in running.items():
+                    if now - started > straggler_timeout and name not in owners:
+                        print(f"[COORDINATOR] {name} takes over slow shard {shard_id}")
+                        owners.add(name)
+                        return shard_id
+
+            cond.wait(timeout=0.05)
+
+        return None
+
+    def release(shard_id: int, name: str):
+        # called with cond held, puts the shard back into the queue if nobody else is running it
+        if shard_id in running:
+            owners = running[shard_id][1]
+            owners.discard(name)
+            if not owners and results[shard_id] is None:
+                del running[shard_id]
+                pending.appendleft(shard_id)
+
+    def receive(conn):
+        # polls in short steps, so the thread gives up on the reply once the run is over (returns None)
+        deadline = None if worker_timeout is None else time.monotonic() + worker_timeout
+        while not conn.poll(0.05):
+            with cond:
+                if finished():
+                    return None
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"no reply within {worker_timeout} s")
+        return conn.recv()
+
+    def drive(address: tuple[str, int]):
+        name = f"{address[0]}:{address[1]}"
+        conn = None
+        shard_id = None
+        try:
+            conn = _connect(address, authkey, worker_timeout)
+            conn.send(("key", exponent, n, crt, mask))
+            if receive(conn) is None:
+                return
+
+            while True:
+                with cond:
+                    shard_id = next_shard(name)
+                if shard_id is None:
+                    conn.send(("close",))
+                    return
+
+                start, stop = shards[shard_id]
+                prev = None
+                if mask is not None:
+                    prev = iv if start == 0 else values[start - 1]
+                conn.send(("shard", shard_id, values[start:stop], prev))
+
+                reply = receive(conn)
+                if reply is None:
+                    return
+                with cond:
+                    if reply[0] == "error":
+                        state["error"] = f"shard {shard_id} failed on {name}: {reply[2]}"
+                    elif results[shard_id] is None:
+                        results[shard_id] = reply[2]
+                        state["done"] += 1
+                    running.pop(shard_id, None)
+                    shard_id = None
+                    cond.notify_all()
+
+        except (EOFError, OSError, AuthenticationError) as ex:
+            if conn is None:
+                print(f"[COORDINATOR] could not connect to {name}: {ex!r}")
+            else:
+                print(f"[COORDINATOR] lost worker {name}: {ex!r}")
+            with cond:
+                if shard_id is not None:
+                    release(shard_id, name)
+        finally:
+            with cond:
+                state["alive"] -= 1
+                cond.notify_all()
+            if conn is not None:
+                conn.close()
+
+    # daemon threads, a hung worker must not keep the coordinator alive
+    threads = [threading.Thread(target=drive, args=(address,), daemon=True) for address in addresses]
+    state["alive"] = len(threads)
+
+    print(f"[COORDINATOR] {len(values)} blocks in {len(shards)} shards, {len(threads)} workers")
+    for thread in threads:
+        thread.start()
+
+    with cond:
+        while not finished() and state["alive"] > 0:
+            cond.wait()
+
+        if state["error"] is not None:
+            raise ValueError(state["error"])
+        if not finished():
+            raise RuntimeError(f"All workers failed, {len(shards) - state['done']} shards left")
+
+    print("[COORDINATOR] all shards done\n")
+    return [r for shard_results in results for r in shard_results]
+
+
+def ecb_encrypt(addresses: list[tuple[str, int]], blocks: list[int], e: int, n: int, authkey: bytes, **options) -> list[int]:
+    """
+    Encrypts blocks (ECB mode) on remote workers, see run_sharded() for the options.
+
+    :param addresses: (host, port) of every worker.
+    :type addresses: list[tuple[str, int]]
+    :param blocks: Blocks to be encrypted.
+    :type blocks: list[int]
+    :param e: Public key.
+    :type e: int
+    :param n: RSA modulus.
+    :type n: int
+    :param authkey: Shared secret of the workers.
+    :type authkey: bytes
+    :return: Encrypted blocks.
+    :rtype: list[int]
+    """
+    if blocks and max(blocks) >= n:
+        raise ValueError("Block too large for modulus")
+
+    return run_sharded(addresses, blocks, e, n, authkey, **options)
+
+
+def ecb_decrypt(addresses: list[tuple[str, int]], encrypted_blocks: list[int], d: int, n: int, authkey: bytes,
+                crt: list[tuple[int, int, int]] | None = None, **options) -> list[int]:
+    """
+    Decrypts blocks (ECB mode) on remote workers, see run_sharded() for the options.
+
+    :param addresses: (host, port) of every worker.
+    :type addresses: list[tuple[str, int]]
+    :param encrypted_blocks: Blocks to be decrypted.
+    :type encrypted_blocks: list[int]
+    :param d: Private key.
+    :type d: int
+    :param n: RSA modulus.
+    :type n: int
+    :param authkey: Shared secret of the workers.
+    :type authkey: bytes
+    :param crt: CRT components of the private key (optional), see rsa_core.keygen_crt().
+    :type crt: list[tuple[int, int, int]] | None
+    :return: Decrypted blocks.
+    :rtype: list[int]
+    """
+    return run_sharded(addresses, encrypted_blocks, d, n, authkey, crt, **options)
+
+
+def cbc_decrypt(addresses: list[tuple[str, int]], encrypted_blocks: list[int], d: int, n: int, iv: int, block_size: int,
+                authkey: bytes, crt: list[tuple[int, int, int]] | None = None, **options) -> list[int]:
+    """
+    Decrypts blocks (CBC mode) on remote workers, see run_sharded() for the options.\n
+    Every shard also gets the ciphertext block before it, so shards can be decrypted independently.
+
+    :param addresses: (host, port) of every worker.
+    :type addresses: list[tuple[str, int]]
+    :param encrypted_blocks: Blocks to be decrypted.
+    :type encrypted_blocks: list[int]
+    :param d: Private key.
+    :type d: int
+    :param n: RSA modulus.
+    :type n: int
+    :param iv: Initialisation vector.
+    :type iv: int
+    :param block_size: Size of blocks (in bytes).
+    :type block_size: int
+    :param authkey: Shared secret of the workers.
+    :type authkey: bytes
+    :param crt: CRT components of the private key (optional), see rsa_core.keygen_crt().
+    :type crt: list[tuple[int, int, int]] | None
+    :return: Decrypted blocks.
+    :rtype: list[int]
+    """
+    mask = (1 << (block_size * 8)) - 1
+    return run_sharded(addresses, encrypted_blocks, d, n, authkey, crt, iv, mask, **options)
+
+
+if __name__ == "__main__":
+    # python3 distributed.py <host> <port>, with the shared secret in RSA_WORKER_AUTHKEY
+    if len(sys.argv) != 3 or "RSA_WORKER_AUTHKEY" not in os.environ:
+        print("Usage: RSA_WORKER_AUTHKEY=<secret> python3 distributed.py <host> <port>")
+        sys.exit(1)
+
+    serve_worker((sys.argv[1], int(sys.argv[2])), os.environ["RSA_WORKER_AUTHKEY"].encode("utf-8"))
@@ -1,9 +1,35 @@
 import rsa_core
 
+def vectorised_engine(n: int):
+    """
+    Returns the NumPy engine (vectorised module) if the modulus is small enough for it
+    and NumPy is installed, None otherwise.
+    """
+    if n >= 1 << 32:
+        return None
+
+    try:
+        import vectorised
+    except ImportError:
+        return None
+
+    return vectorised
+
+
 def rsa_ecb_encrypt(blocks: list[int], e: int, n: int) -> list[int]:
     """Encrypt blocks independently (ECB mode)."""
     print("[ECB-DECRYPT] Starting ECB encryption")
 
+    engine = vectorised_engine(n)
+    if engine is not None:
+        if any(block >= n for block in blocks):
+            raise ValueError("Block too large for modulus")
+
+        encrypted = engine.modexp_blocks(blocks, e, n)
+        print(f"[ECB-ENCRYPT] {len(encrypted)} blocks encrypted with the vectorised engine")
+        print("[ECB-ENCRYPT] ECB encryption complete\n")
+        return encrypted
+
     encrypted = []
     for block in blocks:
         # print(f"[ECB-ENCRYPT] Plaintext block = {block}")
@@ -15,14 +41,21 @@ def rsa_ecb_encrypt(blocks: list[int], e: int, n: int) -> list[int]:
     return encrypted
 
 
-def rsa_ecb_decrypt(encrypted_blocks:  list[int], d: int, n: int) -> list[int]:
-    """Decrypt blocks independently (ECB mode)."""
+def rsa_ecb_decrypt(encrypted_blocks:  list[int], d: int, n: int, crt: list[tuple[int, int, int]] | None = None) -> list[int]:
+    """Decrypt blocks independently (ECB mode), using the CRT components of the key if given."""
     print("[ECB-DECRYPT] Starting ECB decryption")
 
+    engine = vectorised_engine(n)
+    if engine is not None and all(block < n for block in encrypted_blocks):
+        blocks = engine.modexp_blocks(encrypted_blocks, d, n)
+        print(f"[ECB-DECRYPT] {len(blocks)} blocks decrypted with the vectorised engine")
+        print("[ECB-DECRYPT] ECB decryption complete\n")
+        return blocks
+
     blocks = []
     for block in encrypted_blocks:
         # print(f"[ECB-DECRYPT] Ciphertext block = {block}")
-        m = rsa_core.rsa_decrypt_block(block, d, n)
+        m = rsa_core.rsa_decrypt_block(block, d, n, crt)
         # print(f"[ECB-DECRYPT] Plaintext block = {m}")
         blocks.append(m)
 
@@ -30,12 +63,22 @@ def rsa_ecb_decrypt(encrypted_blocks:  list[int], d: int, n: int) -> list[int]:
     return blocks
 
 
-def encrypt_text(text: str, e: int, n: int, block_size: int) -> list[int]:
+def modexp_blocks(blocks: list[int], exponent: int, n: int, crt: list[tuple[int, int, int]] | None = None) -> list[int]:
+    """
+    Raises every block to the exponent (or decrypts it with the CRT components), without any logging.\n
+    Used by the backends (shared_pool, distributed, broadcast) for their share of the blocks.
+    """
+    if crt is not None:
+        return [rsa_core.crt_decrypt(block, crt) for block in blocks]
+    return [pow(block, exponent, n) for block in blocks]
+
+
+def encrypt_text(text: str, e: int, n: int, block_size: int, compression: str | None = None) -> list[int]:
     print("[ECB] Encrypting full text in ECB mode")
     print(f"[ECB] Block size = {block_size} bytes")
 
     rsa_core.validate_block_size(block_size, n)
-    blocks = rsa_core.string_to_blocks(text, block_size)
+    blocks = rsa_core.string_to_blocks(text, block_size, compression)
     
     r = rsa_ecb_encrypt(blocks, e, n)
     print(f"[ECB] Encrypted blocks:\n{r}\n")
@@ -43,8 +86,8 @@ def encrypt_text(text: str, e: int, n: int, block_size: int) -> list[int]:
     return r 
 
 
-def decrypt_text(encrypted_blocks:  list[int], d: int, n: int, block_size:  int) -> str:
+def decrypt_text(encrypted_blocks:  list[int], d: int, n: int, block_size:  int, crt: list[tuple[int, int, int]] | None = None) -> str:
     print("[ECB] Decrypting full ciphertext in ECB mode")
-    blocks = rsa_ecb_decrypt(encrypted_blocks, d, n)
+    blocks = rsa_ecb_decrypt(encrypted_blocks, d, n, crt)
     print("[ECB] ECB decryption finished\n")
     return rsa_core.blocks_to_string(blocks, block_size)
@@ -0,0 +1,107 @@
+from collections.abc import Sequence
+
+# Paging logic of the GUI block viewer, kept free of tkinter so it can be tested on its own.
+# Only the rows on the current page are ever formatted.
+
+def format_block(block: int, fmt: str = "dec", width: int = 0) -> str:
+    """
+    Formats a single block for display.
+
+    :param block: Block (integer) to be formatted.
+    :type block: int
+    :param fmt: "dec" or "hex".
+    :type fmt: str
+    :param width: Block width in bytes, hex blocks are zero-padded to it (0 for no padding).
+    :type width: int
+    :return: Formatted block.
+    :rtype: str
+    """
+    if fmt == "hex":
+        return f"{block:0{width * 2}x}"
+    if fmt == "dec":
+        return str(block)
+
+    raise ValueError(f"Unknown block format: {fmt}")
+
+
+class TextChunks(Sequence):
+    """
+    Read-only view of a text as fixed-size chunks, slicing happens only when a chunk is accessed.
+    """
+    def __init__(self, text: str, chunk_size: int = 64):
+        assert chunk_size >= 1
+        self.text = text
+        self.chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        return -(-len(self.text) // self.chunk_size)
+
+    def __getitem__(self, i: int) -> str:
+        if not -len(self) <= i < len(self):
+            raise IndexError("chunk index out of range")
+        i %= len(self)
+        return self.text[i * self.chunk_size: (i + 1) * self.chunk_size]
+
+
+class BlockPager:
+    """
+    Keeps track of which rows of a (possibly huge) sequence of blocks or text chunks are visible.
+    """
+    def __init__(self, page_size: int = 20):
+        assert page_size >= 1
+        self.page_size = page_size
+        self.items = []
+        self.first = 0
+        self.fmt = "dec"
+        self.width = 0
+
+    def set_items(self, items: Sequence, width: int = 0):
+        """
+        :param items: Blocks (integers) or text chunks to be displayed.
+        :type items: Sequence
+        :param width: Block width in bytes, used for zero-padding hex blocks.
+        :type width: int
+        """
+        self.items = items
+        self.width = width
+        self.first = 0
+
+    def set_page_size(self, page_size: int):
+        self.page_size = max(1, page_size)
+        self.goto(self.first)
+
+    def last_first(self) -> int:
+        """:return: Index of the first row on the last page."""
+        return max(0, len(self.items) - self.page_size)
+
+    def goto(self, i: int):
+        """Scrolls so that row i is the first visible row (as far as possible)."""
+        self.first = max(0, min(i, self.last_first()))
+
+    def scroll(self, rows: int):
+        self.goto(self.first + rows)
+
+    def moveto(self, fraction: float):
+        """Scrolls to a position given as a fraction of the whole sequence (like a scrollbar)."""
+        self.goto(int(fraction * len(self.items)))
+
+    def fractions(self) -> tuple[float, float]:
+        """:return: Visible part of the sequence as fractions, in the form a scrollbar expects."""
+        if not self.items:
+            return 0.0, 1.0
+        total = len(self.items)
+        return self.first / total, min(self.first + self.page_size, total) / total
+
+    def format_row(self, i: int) -> str:
+        item = self.items[i]
+        if isinstance(item, int):
+            item = format_block(item, self.fmt, self.width)
+        else:
+            # one chunk per row, so line breaks are shown escaped
+            item = item.replace("\r", "\\r").replace("\n", "\\n").replace("\t", "\\t")
+        return f"[{i}] {item}"
+
+    def visible_rows(self) -> list[str]:
+        """:return: Formatted rows of the current page."""
+        stop = min(self.first + self.page_size, len(self.items))
+        return [self.format_row(i) for i in range(self.first, stop)]
@@ -1,7 +1,13 @@
-from Crypto.Util import number
+from __future__ import annotations
+
+# same as typing.TYPE_CHECKING (type checkers treat it as True), without the cost of importing typing
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    # only needed for the annotations, random is not imported at runtime
+    import random
 
 # KEYGEN
-def random_prime(no_bits: int) -> int:
+def random_prime(no_bits: int, rng: random.Random | None = None) -> int:
     """
     A function for generating primes of desired length.
     Due to difficulty of this task in cryptography, an external library was used.\n
@@ -10,42 +16,146 @@ def random_prime(no_bits: int) -> int:
     
     :param no_bits: Bit length of the prime factors used to construct the RSA modulus.
     :type no_bits: int
+    :param rng: Seeded randomness source for reproducible primes (optional), NOT cryptographically secure.
+    :type rng: random.Random | None
     :return: random prime.
     :rtype: int
     """
     assert no_bits >= 2
 
-    p = number.getPrime(no_bits)
+    # pycryptodome is slow to import, only pay for it when keys are actually generated
+    from Crypto.Util import number
+
+    p = number.getPrime(no_bits, randfunc=rng.randbytes if rng is not None else None)
     print(f"[KEYGEN] Generated prime ({no_bits} bits): {p}")
     return p
 
-def keygen(no_bits: int) -> tuple[int, int, int]:
+def random_prime_between(low: int, high: int, rng: random.Random | None = None) -> int:
+    """
+    Draws a random prime from the range [low, high], see random_prime().\n
+    Used for the last prime of a modulus of exact size, the range must contain a prime.
+
+    :param low: Smallest allowed value.
+    :type low: int
+    :param high: Largest allowed value.
+    :type high: int
+    :param rng: Seeded randomness source for reproducible primes (optional), NOT cryptographically secure.
+    :type rng: random.Random | None
+    :return: random prime.
+    :rtype: int
     """
-    Generates a private & public key of desired bit length, along with the RSA modulus,
-    to be used in RSA encryption.
+    assert 2 <= low <= high
+
+    from Crypto.Util import number
+
+    randfunc = rng.randbytes if rng is not None else None
+    while True:
+        p = number.getRandomRange(low, high + 1, randfunc=randfunc)
+        if number.isPrime(p, randfunc=randfunc):
+            print(f"[KEYGEN] Generated prime ({p.bit_length()} bits): {p}")
+            return p
+
+def keygen(no_bits: int | None = None, no_primes: int = 2, rng: random.Random | None = None, *,
+           modulus_bits: int | None = None) -> tuple[int, int, int]:
+    """
+    Generates a private & public key, along with the RSA modulus,
+    to be used in RSA encryption.\n
+    The CRT components of the private key are discarded, use keygen_crt() to keep them.
     
-    :param no_bits: Bit length of private, public encryption key.
-    :type no_bits: int
+    :param no_bits: Bit length of each prime factor of the RSA modulus (or use modulus_bits).
+    :type no_bits: int | None
+    :param no_primes: Number of distinct primes the RSA modulus is built from.
+    :type no_primes: int
+    :param rng: Seeded randomness source for reproducible keys (optional), see random_prime().
+    :type rng: random.Random | None
+    :param modulus_bits: Exact bit length of the RSA modulus, split across the primes (or use no_bits).
+    :type modulus_bits: int | None
     :return: public key, private key, RSA modulus.
     :rtype: tuple[int, int, int]
     """
-    # get 2 distinct primes
-    p = random_prime(no_bits)
-    q = random_prime(no_bits)
-    while p == q:
-        q = random_prime(no_bits)
+    e, d, n, _ = keygen_crt(no_bits, no_primes, rng, modulus_bits=modulus_bits)
+    return e, d, n
+
+def split_modulus_bits(modulus_bits: int, no_primes: int) -> list[int]:
+    """
+    Splits the bit length of the modulus as evenly as possible across the primes.
+
+    :param modulus_bits: Bit length of the RSA modulus.
+    :type modulus_bits: int
+    :param no_primes: Number of primes.
+    :type no_primes: int
+    :return: Bit length of every prime, the longest first.
+    :rtype: list[int]
+    """
+    base, extra = divmod(modulus_bits, no_primes)
+    return [base + 1] * extra + [base] * (no_primes - extra)
 
-    print(f"[KEYGEN] p = {p}")
-    print(f"[KEYGEN] q = {q}")
+def keygen_crt(no_bits: int | None = None, no_primes: int = 2, rng: random.Random | None = None, *,
+               modulus_bits: int | None = None) -> tuple[int, int, int, list[tuple[int, int, int]]]:
+    """
+    Generates a (multi-prime) RSA key, along with the Chinese Remainder Theorem (CRT)
+    components of the private key.\n
+    With no_bits each prime is no_bits long, so the modulus is roughly no_bits * no_primes bits.
+    With modulus_bits the modulus is exactly modulus_bits long and the primes share it evenly,
+    so for a modulus of a given size, more primes means smaller (cheaper) CRT exponentiations.
+    
+    :param no_bits: Bit length of each prime factor of the RSA modulus (or use modulus_bits).
+    :type no_bits: int | None
+    :param no_primes: Number of distinct primes the RSA modulus is built from.
+    :type no_primes: int
+    :param rng: Seeded randomness source for reproducible keys (optional), see random_prime().
+    :type rng: random.Random | None
+    :param modulus_bits: Exact bit length of the RSA modulus, split across the primes (or use no_bits).
+    :type modulus_bits: int | None
+    :return: public key, private key, RSA modulus, CRT components (prime, exponent, coefficient).
+    :rtype: tuple[int, int, int, list[tuple[int, int, int]]]
+    """
+    assert no_primes >= 2
+    if (no_bits is None) == (modulus_bits is None):
+        raise ValueError("Give either the prime size (no_bits) or the modulus size (modulus_bits)")
+
+    if modulus_bits is not None:
+        prime_bits = split_modulus_bits(modulus_bits, no_primes)
+        if prime_bits[-1] < 8:
+            raise ValueError(f"Modulus of {modulus_bits} bits is too small for {no_primes} primes")
+    else:
+        prime_bits = [no_bits] * no_primes
+
+    # get distinct primes, with modulus_bits the last one is drawn separately to get the exact size
+    no_drawn = no_primes if modulus_bits is None else no_primes - 1
+    primes = []
+    while len(primes) < no_drawn:
+        r = random_prime(prime_bits[len(primes)], rng)
+        if r not in primes:
+            primes.append(r)
+
+    if modulus_bits is not None:
+        # the last prime makes up the rest: 2^(modulus_bits-1) <= product * r < 2^modulus_bits
+        product = 1
+        for r in primes:
+            product *= r
+        low = -(-(1 << (modulus_bits - 1)) // product)
+        high = ((1 << modulus_bits) - 1) // product
+        while len(primes) < no_primes:
+            r = random_prime_between(low, high, rng)
+            if r not in primes:
+                primes.append(r)
+
+    for i, r in enumerate(primes, start=1):
+        print(f"[KEYGEN] r_{i} = {r}")
 
     # modulus
-    n = p * q
+    n = 1
+    for r in primes:
+        n *= r
 
-    print(f"[KEYGEN] RSA modulus n = p*q = {n}")
+    print(f"[KEYGEN] RSA modulus n = r_1*...*r_{no_primes} = {n}")
     print(f"[KEYGEN] bit length of n = {n.bit_length()}")
 
     # Eulers totient (for prime numbers)
-    phi = (p - 1) * (q - 1)
+    phi = 1
+    for r in primes:
+        phi *= r - 1
     
     # public exponent
     e = 65537
@@ -62,8 +172,58 @@ def keygen(no_bits: int) -> tuple[int, int, int]:
 
     print(f"[KEYGEN] Private exponent d = {d}")
 
+    crt = crt_components(primes, d)
+
     print("[KEYGEN] Key generation complete\n")
-    return e, d, n
+    return e, d, n, crt
+
+def crt_components(primes: list[int], d: int) -> list[tuple[int, int, int]]:
+    """
+    Computes the CRT components of a private key (as in PKCS #1 multi-prime RSA).\n
+    For every prime r_i: the exponent d_i = d mod (r_i - 1) and the coefficient
+    t_i = (r_1 * ... * r_(i-1))^-1 mod r_i. The first prime has no coefficient (t_1 = 1).
+
+    :param primes: Distinct prime factors of the RSA modulus.
+    :type primes: list[int]
+    :param d: Private exponent.
+    :type d: int
+    :return: CRT components (prime, exponent, coefficient) for every prime.
+    :rtype: list[tuple[int, int, int]]
+    """
+    crt = []
+    product = 1
+    for r in primes:
+        d_r = d % (r - 1)
+        t_r = pow(product, -1, r) if product > 1 else 1
+        print(f"[KEYGEN] CRT component: r = {r}, d_r = {d_r}, t_r = {t_r}")
+        crt.append((r, d_r, t_r))
+        product *= r
+
+    return crt
+
+def crt_decrypt(c: int, crt: list[tuple[int, int, int]]) -> int:
+    """
+    Computes c^d mod n from the CRT components of the private key (Garner's algorithm).\n
+    Each exponentiation works modulo a single prime, which is much cheaper than one
+    exponentiation modulo n.
+
+    :param c: Ciphertext block.
+    :type c: int
+    :param crt: CRT components (prime, exponent, coefficient), see crt_components().
+    :type crt: list[tuple[int, int, int]]
+    :return: Decrypted block.
+    :rtype: int
+    """
+    r_1, d_1, _ = crt[0]
+    m = pow(c, d_1, r_1)
+    product = r_1
+    for r, d_r, t_r in crt[1:]:
+        m_r = pow(c, d_r, r)
+        h = ((m_r - m) * t_r) % r
+        m += product * h
+        product *= r
+
+    return m
 
 # CONVERTING THE DATA INTO BLOCKS
 def validate_block_size(block_size: int, n: int):
@@ -83,6 +243,17 @@ def validate_block_size(block_size: int, n: int):
         print(f"[BLOCK CHECK] block size invalid for RSA modulus")
         raise ValueError("Block size too large for RSA modulus")
 
+def record_width(n: int) -> int:
+    """
+    Width of a fixed-size record holding one ciphertext block, as used when blocks are stored or sent as bytes.
+
+    :param n: RSA modulus.
+    :type n: int
+    :return: Width (in bytes) of a record that can hold any block smaller than n.
+    :rtype: int
+    """
+    return (n.bit_length() + 7) // 8
+
 def pad_message(message: bytes, block_size: int) -> bytes:
     """
     Pads the message so that its length is a multiple of the block size.
@@ -117,7 +288,82 @@ def unpad_message(message: bytes) -> bytes:
     print(f"[UNPADDING] detected padding length = {padding_len} bytes")
     return message[:-padding_len]
 
-def string_to_blocks(text: str, block_size: int) -> list[int]:
+# COMPRESSION
+# flag byte stored in front of a compressed message.
+# 0xF8-0xFF never occur in UTF-8, so a compressed message can be told apart from plain text when decrypting
+COMPRESSION_FLAGS = {
+    "zlib": 0xF9,
+    "lzma": 0xFA,
+    "bz2": 0xFB,
+}
+
+def compress_message(message: bytes, method: str, block_size: int | None = None) -> bytes:
+    """
+    Compresses the message before padding, so there are fewer blocks to encrypt.\n
+    The result starts with a flag byte recording the method. If compression (flag byte included)
+    does not save a block after padding, or a byte if block_size is not given,
+    the message is stored uncompressed (without a flag byte).
+
+    :param message: Message to be compressed in byte form.
+    :type message: bytes
+    :param method: Standard library module used for compression ("zlib", "lzma" or "bz2").
+    :type method: str
+    :param block_size: Block size (in bytes) the message is padded to afterwards (optional).
+    :type block_size: int | None
+    :return: Flag byte followed by the compressed message, or the message itself.
+    :rtype: bytes
+    """
+    if method not in COMPRESSION_FLAGS:
+        raise ValueError(f"Unknown compression method: {method}")
+
+    # the codec modules (and importlib) are only imported when compression is actually used
+    import importlib
+    codec = importlib.import_module(method)
+    compressed = codec.compress(message)
+
+    print(f"[COMPRESSION] {method}: {len(message)} -> {len(compressed)} bytes")
+
+    packed_len = len(compressed) + 1
+    if block_size is not None:
+        # pad_message() always adds at least one byte, so a message takes len // block_size + 1 blocks
+        gain = len(message) // block_size - packed_len // block_size
+    else:
+        gain = len(message) - packed_len
+
+    if gain <= 0:
+        print("[COMPRESSION] no gain, message stored uncompressed")
+        return message
+
+    return bytes([COMPRESSION_FLAGS[method]]) + compressed
+
+
+def decompress_message(message: bytes) -> bytes:
+    """
+    Reverses compress_message(), using the method recorded in the flag byte.\n
+    A message that does not start with a flag byte (UTF-8 text) is returned as is,
+    so it is safe to call on every decrypted message.
+
+    :param message: Flag byte followed by the compressed message, or an uncompressed message.
+    :type message: bytes
+    :return: Decompressed message.
+    :rtype: bytes
+    """
+    if not message or message[0] < 0xF8:
+        # no flag byte, stored uncompressed
+        return message
+
+    flag = message[0]
+    for method, method_flag in COMPRESSION_FLAGS.items():
+        if method_flag == flag:
+            import importlib
+            codec = importlib.import_module(method)
+            decompressed = codec.decompress(message[1:])
+            print(f"[DECOMPRESSION] {method}: {len(message) - 1} -> {len(decompressed)} bytes")
+            return decompressed
+
+    raise ValueError(f"Unknown compression flag: {flag}")
+
+def string_to_blocks(text: str, block_size: int, compression: str | None = None) -> list[int]:
     """
     Converts a string to a list of integers representing message blocks, ready for encryption.
     
@@ -125,6 +371,8 @@ def string_to_blocks(text: str, block_size: int) -> list[int]:
     :type text: str
     :param block_size: Desired size of blocks (bytes).
     :type block_size: int
+    :param compression: Compression method applied before padding (optional), see compress_message().
+    :type compression: str | None
     :return: Text converted to a list of integers "blocks".
     :rtype: list[int]
     """
@@ -135,6 +383,9 @@ def string_to_blocks(text: str, block_size: int) -> list[int]:
     message = text.encode("utf-8")
     print(f"[BLOCKING] UTF-8 encoded bytes:\n{message}")
 
+    if compression is not None:
+        message = compress_message(message, compression, block_size)
+
     message = pad_message(message, block_size)
     print(f"[BLOCKING] padded message:\n{message}")
 
@@ -157,7 +408,7 @@ def blocks_to_string(blocks: list[int], block_size: int) -> str:
     :type blocks: list[int]
     :param block_size: Size of blocks.
     :type block_size: int
-    :return: Converted text.
+    :return: Converted text, decompressed if it was blocked with compression (see string_to_blocks()).
     :rtype: str
     """
     message = b""
@@ -168,6 +419,8 @@ def blocks_to_string(blocks: list[int], block_size: int) -> str:
     message = unpad_message(message)
     print(f"[UNBLOCKING] unpadded message bytes:\n{message}")
 
+    message = decompress_message(message)
+
     return message.decode("utf-8")
 
 # Wiktor add your documentation here
@@ -193,7 +446,7 @@ def rsa_encrypt_block(m: int, e: int, n: int) -> int:
     return r
 
 
-def rsa_decrypt_block(c: int, d: int, n: int) -> int:
+def rsa_decrypt_block(c: int, d: int, n: int, crt: list[tuple[int, int, int]] | None = None) -> int:
     """
     Docstring for rsa_decrypt_block
     
@@ -203,10 +456,15 @@ def rsa_decrypt_block(c: int, d: int, n: int) -> int:
     :type d: int
     :param n: Description
     :type n: int
+    :param crt: CRT components of the private key (optional), see keygen_crt().
+    :type crt: list[tuple[int, int, int]] | None
     :return: Description
     :rtype: int
     """
-    r = pow(c, d, n)
+    if crt is not None:
+        r = crt_decrypt(c, crt)
+    else:
+        r = pow(c, d, n)
     print(f"[DECRYPT] ciphertext block c = {c}")
-    print(f"[DECRYPT] recovered plaintext block m = c^d mod n = {pow(c, d, n)}")
-    return r
\ No newline at end of file
+    print(f"[DECRYPT] recovered plaintext block m = c^d mod n = {r}")
+    return r
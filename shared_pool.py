@@ -0,0 +1,184 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed, wait
+from multiprocessing import shared_memory
+import os
+import rsa_core
+import ecb
+import cbc
+
+# Worker-pool backend for the ECB/CBC block work.
+# The blocks are stored as fixed-width (big-endian) records in shared memory segments,
+# workers read and write their slice of records in place, so only index ranges are pickled.
+
+def _process_range(src_name: str, dst_name: str, width: int, start: int, stop: int,
+                   exponent: int, n: int, crt: list[tuple[int, int, int]] | None,
+                   iv: int | None, mask: int | None) -> int:
+    """
+    Runs in a worker process: raises records [start, stop) of the source segment to the exponent
+    (or decrypts them with the CRT components) and writes the results into the destination segment.\n
+    If iv is given the records are CBC ciphertext and the output is unchained (XOR with the previous record).
+    """
+    src = shared_memory.SharedMemory(name=src_name)
+    try:
+        dst = shared_memory.SharedMemory(name=dst_name)
+        try:
+            src_buf, dst_buf = src.buf, dst.buf
+            values = [int.from_bytes(src_buf[i*width: (i+1)*width], byteorder="big") for i in range(start, stop)]
+
+            if iv is None:
+                results = ecb.modexp_blocks(values, exponent, n, crt)
+            else:
+                prev = iv if start == 0 else int.from_bytes(src_buf[(start-1)*width: start*width], byteorder="big")
+                results = cbc.decrypt_blocks(values, exponent, n, prev, mask.bit_length() // 8, crt)
+
+            dst_buf[start*width: stop*width] = b"".join(r.to_bytes(width, byteorder="big") for r in results)
+            del src_buf, dst_buf
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
+    return stop - start
+
+
+def _map_shared(values: list[int], n: int, exponent: int, crt: list[tuple[int, int, int]] | None = None,
+                iv: int | None = None, mask: int | None = None,
+                workers: int | None = None, chunk_size: int | None = None,
+                executor: Executor | None = None) -> list[int]:
+    """
+    Copies the values into a shared memory segment, lets the worker pool process them in index ranges
+    and reads the results back from a second segment.\n
+    The pool is the given executor (left running for later calls) or a new one, shut down when done.
+    Both segments are unlinked even if a worker fails or the run is interrupted,
+    outstanding ranges are cancelled first.
+    """
+    count = len(values)
+    if count == 0:
+        return []
+
+    width = rsa_core.record_width(n)
+    size = count * width
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        # a few ranges per worker, so a slow range does not hold up the whole run
+        chunk_size = max(1, -(-count // (workers * 4)))
+
+    src = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        dst = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            src.buf[:size] = b"".join(v.to_bytes(width, byteorder="big") for v in values)
+            print(f"[SHARED-POOL] {count} records of {width} bytes, {workers} workers, ranges of {chunk_size}")
+
+            pool = executor if executor is not None else ProcessPoolExecutor(max_workers=workers)
+            futures = []
+            try:
+                for start in range(0, count, chunk_size):
+                    futures.append(pool.submit(_process_range, src.name, dst.name, width, start,
+                                               min(start + chunk_size, count), exponent, n, crt, iv, mask))
+                for future in as_completed(futures):
+                    future.result()
+            finally:
+                # cancel what has not started yet and wait for running workers to detach
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+                if executor is None:
+                    pool.shutdown()
+
+            data = dst.buf[:size].tobytes()
+        finally:
+            dst.close()
+            dst.unlink()
+    finally:
+        src.close()
+        src.unlink()
+
+    return [int.from_bytes(data[i: i+width], byteorder="big") for i in range(0, size, width)]
+
+
+def ecb_encrypt(blocks: list[int], e: int, n: int, workers: int | None = None, chunk_size: int | None = None,
+                executor: Executor | None = None) -> list[int]:
+    """
+    Encrypts blocks independently (ECB mode) on a worker pool, see ecb.rsa_ecb_encrypt().
+
+    :param blocks: Blocks to be encrypted.
+    :type blocks: list[int]
+    :param e: Public key.
+    :type e: int
+    :param n: RSA modulus.
+    :type n: int
+    :param workers: Number of worker processes (default: number of CPUs).
+    :type workers: int | None
+    :param chunk_size: Number of records in each index range handed to a worker.
+    :type chunk_size: int | None
+    :param executor: Long-lived pool to run the ranges on (optional), a new ProcessPoolExecutor is used otherwise.
+    :type executor: concurrent.futures.Executor | None
+    :return: Encrypted blocks.
+    :rtype: list[int]
+    """
+    if blocks and max(blocks) >= n:
+        raise ValueError("Block too large for modulus")
+
+    return _map_shared(blocks, n, e, workers=workers, chunk_size=chunk_size, executor=executor)
+
+
+def ecb_decrypt(encrypted_blocks: list[int], d: int, n: int, crt: list[tuple[int, int, int]] | None = None,
+                workers: int | None = None, chunk_size: int | None = None,
+                executor: Executor | None = None) -> list[int]:
+    """
+    Decrypts blocks independently (ECB mode) on a worker pool, see ecb.rsa_ecb_decrypt().
+
+    :param encrypted_blocks: Blocks to be decrypted.
+    :type encrypted_blocks: list[int]
+    :param d: Private key.
+    :type d: int
+    :param n: RSA modulus.
+    :type n: int
+    :param crt: CRT components of the private key (optional), see rsa_core.keygen_crt().
+    :type crt: list[tuple[int, int, int]] | None
+    :param workers: Number of worker processes (default: number of CPUs).
+    :type workers: int | None
+    :param chunk_size: Number of records in each index range handed to a worker.
+    :type chunk_size: int | None
+    :param executor: Long-lived pool to run the ranges on (optional), a new ProcessPoolExecutor is used otherwise.
+    :type executor: concurrent.futures.Executor | None
+    :return: Decrypted blocks.
+    :rtype: list[int]
+    """
+    return _map_shared(encrypted_blocks, n, d, crt, workers=workers, chunk_size=chunk_size, executor=executor)
+
+
+def cbc_decrypt(encrypted_blocks: list[int], d: int, n: int, iv: int, block_size: int,
+                crt: list[tuple[int, int, int]] | None = None,
+                workers: int | None = None, chunk_size: int | None = None,
+                executor: Executor | None = None) -> list[int]:
+    """
+    Decrypts blocks in CBC mode on a worker pool, see cbc.rsa_cbc_decrypt().\n
+    Unlike encryption, CBC decryption does not depend on earlier results
+    (every block only needs the previous ciphertext block), so it can be split into ranges.
+
+    :param encrypted_blocks: Blocks to be decrypted.
+    :type encrypted_blocks: list[int]
+    :param d: Private key.
+    :type d: int
+    :param n: RSA modulus.
+    :type n: int
+    :param iv: Initialisation vector.
+    :type iv: int
+    :param block_size: Size of blocks (in bytes).
+    :type block_size: int
+    :param crt: CRT components of the private key (optional), see rsa_core.keygen_crt().
+    :type crt: list[tuple[int, int, int]] | None
+    :param workers: Number of worker processes (default: number of CPUs).
+    :type workers: int | None
+    :param chunk_size: Number of records in each index range handed to a worker.
+    :type chunk_size: int | None
+    :param executor: Long-lived pool to run the ranges on (optional), a new ProcessPoolExecutor is used otherwise.
+    :type executor: concurrent.futures.Executor | None
+    :return: Decrypted blocks.
+    :rtype: list[int]
+    """
+    mask = (1 << (block_size * 8)) - 1
+    return _map_shared(encrypted_blocks, n, d, crt, iv, mask, workers=workers, chunk_size=chunk_size, executor=executor)
@@ -0,0 +1,149 @@
+import hashlib
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
+import os
+import rsa_core
+
+# NOTE textbook RSA signatures (no PSS padding), same as the rest of the project this is not meant for real-world use.
+
+# SIGNING
+def hash_message(message: str | bytes, n: int) -> int:
+    """
+    Hashes a message (SHA-256) into an integer that can be signed with the RSA modulus n.\n
+    For moduli shorter than the digest (small teaching keys) the digest is reduced mod n.
+
+    :param message: Message to be hashed, text is UTF-8 encoded first.
+    :type message: str | bytes
+    :param n: RSA modulus.
+    :type n: int
+    :return: Message digest as an integer smaller than n.
+    :rtype: int
+    """
+    if isinstance(message, str):
+        message = message.encode("utf-8")
+
+    digest = hashlib.sha256(message).digest()
+    return int.from_bytes(digest, byteorder="big") % n
+
+
+def sign(message: str | bytes, d: int, n: int, crt: list[tuple[int, int, int]] | None = None) -> int:
+    """
+    Signs a message with the private key: s = H(m)^d mod n.
+
+    :param message: Message to be signed.
+    :type message: str | bytes
+    :param d: Private key.
+    :type d: int
+    :param n: RSA modulus.
+    :type n: int
+    :param crt: CRT components of the private key (optional), see rsa_core.keygen_crt().
+    :type crt: list[tuple[int, int, int]] | None
+    :return: Signature.
+    :rtype: int
+    """
+    h = hash_message(message, n)
+    print(f"[SIGN] message digest = {h}")
+
+    s = rsa_core.rsa_decrypt_block(h, d, n, crt)
+    print(f"[SIGN] signature s = H(m)^d mod n = {s}\n")
+    return s
+
+
+def verify(message: str | bytes, signature: int, e: int, n: int) -> bool:
+    """
+    Verifies a signature with the public key: s^e mod n == H(m).
+
+    :param message: Signed message.
+    :type message: str | bytes
+    :param signature: Signature to be checked.
+    :type signature: int
+    :param e: Public key.
+    :type e: int
+    :param n: RSA modulus.
+    :type n: int
+    :return: True if the signature is valid.
+    :rtype: bool
+    """
+    if not 0 <= signature < n:
+        print("[VERIFY] signature out of range for RSA modulus")
+        return False
+
+    h = hash_message(message, n)
+    valid = rsa_core.rsa_encrypt_block(signature, e, n) == h
+    print(f"[VERIFY] signature valid = {valid}\n")
+    return valid
+
+# BATCH VERIFICATION
+# default chunking: a few chunks per worker, but not so small that pickling dominates the (cheap) checks
+CHUNKS_PER_WORKER = 4
+MIN_CHUNK_SIZE = 64
+
+def _verify_chunk(items: list[tuple[str | bytes, int]], e: int, n: int) -> list[bool]:
+    """
+    Verifies a chunk of (message, signature) pairs without any logging, runs in the worker processes.
+    With e = 65537 a single check is cheap, so the per-item work is kept to one hash and one pow().
+    """
+    sha256 = hashlib.sha256
+    results = []
+    for message, signature in items:
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+
+        if not 0 <= signature < n:
+            results.append(False)
+            continue
+
+        h = int.from_bytes(sha256(message).digest(), byteorder="big") % n
+        results.append(pow(signature, e, n) == h)
+
+    return results
+
+
+def verify_batch(items: list[tuple[str | bytes, int]], e: int, n: int, workers: int | None = None,
+                 chunk_size: int | None = None, executor: Executor | None = None) -> list[bool]:
+    """
+    Verifies many signatures made with one key pair across a process pool.\n
+    The items are split into chunks, so the key and the pickling overhead are paid once per chunk
+    instead of once per signature. By default every worker gets a few chunks (so a slow chunk does not
+    hold up the batch), but chunks are never smaller than MIN_CHUNK_SIZE.
+    Batches that fit into a single chunk, or workers=1, are verified in-process.\n
+    To avoid starting a new pool on every call, pass a long-lived executor (which is not shut down here).
+
+    :param items: (message, signature) pairs to be checked.
+    :type items: list[tuple[str | bytes, int]]
+    :param e: Public key.
+    :type e: int
+    :param n: RSA modulus.
+    :type n: int
+    :param workers: Number of worker processes (default: number of CPUs), also used for the chunk size with an executor.
+    :type workers: int | None
+    :param chunk_size: Number of signatures sent to a worker at a time (default: derived from len(items) and workers).
+    :type chunk_size: int | None
+    :param executor: Pool to run the chunks on (optional), a new ProcessPoolExecutor is used otherwise.
+    :type executor: concurrent.futures.Executor | None
+    :return: Validity of every signature, in the same order as items.
+    :rtype: list[bool]
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(MIN_CHUNK_SIZE, -(-len(items) // (workers * CHUNKS_PER_WORKER)))
+    assert chunk_size >= 1
+
+    chunks = [items[i: i+chunk_size] for i in range(0, len(items), chunk_size)]
+    print(f"[VERIFY-BATCH] {len(items)} signatures in {len(chunks)} chunks")
+
+    if len(chunks) <= 1 or (workers == 1 and executor is None):
+        results = _verify_chunk(items, e, n)
+    else:
+        results = []
+        pool = executor if executor is not None else ProcessPoolExecutor(max_workers=workers)
+        try:
+            for chunk_results in pool.map(_verify_chunk, chunks, repeat(e), repeat(n)):
+                results.extend(chunk_results)
+        finally:
+            if executor is None:
+                pool.shutdown()
+
+    print(f"[VERIFY-BATCH] {sum(results)}/{len(results)} signatures valid\n")
+    return results
@@ -1,6 +1,7 @@
 import base64
 import rsa_core
 import ecb
+import transport
 
 
 RED = "\033[31m"
@@ -35,6 +36,9 @@ def main():
     print("\nCiphertext blocks (integers):")
     for c in encrypted_blocks:
         print(f"\n {RED}{c}{RESET}")
+
+    print("\nCiphertext (base64 transport encoding):")
+    print(f"\n {RED}{transport.encode(encrypted_blocks, n, 'ECB', BLOCK_SIZE)}{RESET}")
     print()
 
     decrypted_blocks = ecb.rsa_ecb_decrypt(encrypted_blocks, d, n)
@@ -1,7 +1,25 @@
 import rsa_core
 import ecb  
 import cbc
+import signing
+import shared_pool
+import distributed
+import paging
+import broadcast
+import transport
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unittest
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.connection import Client
 
 
 #Fixed test keys for reference value testing
@@ -25,6 +43,35 @@ REFERENCE_TEST_VECTORS = [
 ]
 
 
+#Session-wide key fixtures, keyed by prime size, prime count and seed.
+#Seeded keygen is deterministic, so the keys are also persisted between runs (.key_cache.json, not committed).
+#Delete the file to regenerate them.
+KEY_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".key_cache.json")
+_key_cache = None
+
+def cached_keygen(no_bits: int, seed: int, no_primes: int = 2) -> tuple[int, int, int, list[tuple[int, int, int]]]:
+    """Returns rsa_core.keygen_crt(no_bits, no_primes, random.Random(seed)), generated at most once."""
+    global _key_cache
+    if _key_cache is None:
+        try:
+            with open(KEY_CACHE_FILE) as f:
+                _key_cache = json.load(f)
+        except (OSError, ValueError):
+            _key_cache = {}
+
+    cache_key = f"{no_bits}-{no_primes}-{seed}"
+    if cache_key not in _key_cache:
+        _key_cache[cache_key] = rsa_core.keygen_crt(no_bits, no_primes, random.Random(seed))
+
+        # write to a temporary file first, so an interrupted run cannot leave a broken cache behind
+        with open(KEY_CACHE_FILE + ".tmp", "w") as f:
+            json.dump(_key_cache, f)
+        os.replace(KEY_CACHE_FILE + ".tmp", KEY_CACHE_FILE)
+
+    e, d, n, crt = _key_cache[cache_key]
+    return e, d, n, [tuple(component) for component in crt]
+
+
 class TestRSAReferenceValues(unittest.TestCase):
     """
     Test class using externally verifiable reference values.
@@ -105,7 +152,7 @@ class TestRSAReferenceValues(unittest.TestCase):
 
 class TestRSAModes(unittest.TestCase):
     def setUp(self):
-        self.e, self.d, self.n = rsa_core.keygen(128)
+        self.e, self.d, self.n, _ = cached_keygen(128, seed=1)
 
         self.block_size = 16 
 
@@ -187,5 +234,690 @@ class TestRSAModes(unittest.TestCase):
         with self.assertRaises(ValueError):
             ecb.encrypt_text("This should fail", self.e, self.n, too_large_block_size)
 
+
+class TestMultiPrimeRSA(unittest.TestCase):
+    def setUp(self):
+        self.e, self.d, self.n, self.crt = cached_keygen(64, seed=1, no_primes=3)
+
+        self.block_size = 16
+
+        rsa_core.validate_block_size(self.block_size, self.n)
+
+    def test_multi_prime_modulus(self):
+        print("\n--- Testing Multi-Prime Modulus ---")
+        primes = [r for r, _, _ in self.crt]
+
+        self.assertEqual(len(set(primes)), 3)
+        self.assertEqual(primes[0] * primes[1] * primes[2], self.n)
+
+    def test_crt_matches_plain_decryption(self):
+        print("\n--- Testing CRT Decryption ---")
+        for m in (0, 1, 65, 2 ** 100 + 7, self.n - 1):
+            with self.subTest(plaintext=m):
+                c = rsa_core.rsa_encrypt_block(m, self.e, self.n)
+                self.assertEqual(rsa_core.rsa_decrypt_block(c, self.d, self.n, self.crt), m)
+                self.assertEqual(rsa_core.rsa_decrypt_block(c, self.d, self.n), m)
+
+    def test_ecb_multi_prime(self):
+        print("\n--- Testing ECB Mode (3 primes, CRT) ---")
+        original_text = "Hello, this is a test of multi-prime RSA ECB mode."
+
+        encrypted_blocks = ecb.encrypt_text(original_text, self.e, self.n, self.block_size)
+        decrypted_text = ecb.decrypt_text(encrypted_blocks, self.d, self.n, self.block_size, self.crt)
+
+        self.assertEqual(original_text, decrypted_text)
+
+    def test_cbc_multi_prime(self):
+        print("\n--- Testing CBC Mode (3 primes, CRT) ---")
+        original_text = "Bicycle Day is an unofficial celebration..."
+
+        iv, encrypted_blocks = cbc.encrypt_text(original_text, self.e, self.n, self.block_size)
+        decrypted_text = cbc.decrypt_text(encrypted_blocks, self.d, self.n, iv, self.block_size, self.crt)
+
+        self.assertEqual(original_text, decrypted_text)
+
+    def test_quiet_helpers_match(self):
+        print("\n--- Testing Quiet ECB/CBC Helpers ---")
+        blocks = rsa_core.string_to_blocks("Chaining rules shared by every backend.", self.block_size)
+        iv = cbc.generate_iv(self.block_size, random.Random(3))
+
+        encrypted = ecb.rsa_ecb_encrypt(blocks, self.e, self.n)
+        self.assertEqual(ecb.modexp_blocks(blocks, self.e, self.n), encrypted)
+        self.assertEqual(ecb.modexp_blocks(encrypted, self.d, self.n, self.crt), blocks)
+
+        encrypted = cbc.rsa_cbc_encrypt(blocks, self.e, self.n, iv, self.block_size)
+        self.assertEqual(cbc.encrypt_blocks(blocks, self.e, self.n, iv, self.block_size), encrypted)
+
+        # runs decrypted on their own, with the ciphertext block before the run
+        self.assertEqual(cbc.decrypt_blocks(encrypted[:2], self.d, self.n, iv, self.block_size, self.crt), blocks[:2])
+        self.assertEqual(cbc.decrypt_blocks(encrypted[2:], self.d, self.n, encrypted[1], self.block_size), blocks[2:])
+
+    def test_two_primes_default(self):
+        print("\n--- Testing Default Prime Count ---")
+        e, d, n, crt = rsa_core.keygen_crt(64)
+
+        self.assertEqual(len(crt), 2)
+        self.assertEqual(crt[0][0] * crt[1][0], n)
+
+    def test_modulus_bits(self):
+        print("\n--- Testing Modulus Of Exact Size ---")
+        for modulus_bits, no_primes in ((512, 2), (512, 3), (512, 4), (131, 3)):
+            with self.subTest(modulus_bits=modulus_bits, no_primes=no_primes):
+                e, d, n, crt = rsa_core.keygen_crt(no_primes=no_primes, rng=random.Random(1), modulus_bits=modulus_bits)
+                primes = [r for r, _, _ in crt]
+
+                self.assertEqual(n.bit_length(), modulus_bits)
+                self.assertEqual(len(set(primes)), no_primes)
+                # the primes share the modulus evenly
+                self.assertLessEqual(max(primes).bit_length() - min(primes).bit_length(), 2)
+
+                m = 2 ** 100 + 7
+                c = rsa_core.rsa_encrypt_block(m, e, n)
+                self.assertEqual(rsa_core.rsa_decrypt_block(c, d, n, crt), m)
+
+    def test_key_size_arguments(self):
+        with self.assertRaises(ValueError):
+            rsa_core.keygen()
+        with self.assertRaises(ValueError):
+            rsa_core.keygen(64, modulus_bits=128)
+
+
+class TestSigning(unittest.TestCase):
+    def setUp(self):
+        self.e, self.d, self.n, self.crt = cached_keygen(256, seed=1)
+
+    def test_sign_verify(self):
+        print("\n--- Testing Sign / Verify ---")
+        message = "Pay Bob 10 pounds."
+        signature = signing.sign(message, self.d, self.n, self.crt)
+
+        self.assertTrue(signing.verify(message, signature, self.e, self.n))
+        self.assertEqual(signature, signing.sign(message, self.d, self.n))
+
+    def test_tampered_message(self):
+        print("\n--- Testing Tampered Message ---")
+        signature = signing.sign("Pay Bob 10 pounds.", self.d, self.n)
+
+        self.assertFalse(signing.verify("Pay Bob 99 pounds.", signature, self.e, self.n))
+        self.assertFalse(signing.verify("Pay Bob 10 pounds.", signature + self.n, self.e, self.n))
+
+    def test_verify_batch(self):
+        print("\n--- Testing Batch Verification ---")
+        messages = [f"message {i}".encode("utf-8") for i in range(50)]
+        items = [(m, signing.sign(m, self.d, self.n, self.crt)) for m in messages]
+
+        # corrupt a couple of signatures
+        items[3] = (items[3][0], items[3][1] ^ 1)
+        items[40] = (b"forged", items[40][1])
+        expected = [i not in (3, 40) for i in range(50)]
+
+        self.assertEqual(signing.verify_batch(items, self.e, self.n, workers=2, chunk_size=8), expected)
+        self.assertEqual(signing.verify_batch(items, self.e, self.n, workers=1), expected)
+
+    def test_verify_batch_shared_executor(self):
+        print("\n--- Testing Batch Verification With A Shared Pool ---")
+        items = [(f"message {i}", signing.sign(f"message {i}", self.d, self.n, self.crt)) for i in range(300)]
+        items[123] = ("forged", items[123][1])
+        expected = [i != 123 for i in range(300)]
+
+        # default chunking spreads 300 items over 2 workers, the pool is reused between calls
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            for _ in range(2):
+                self.assertEqual(signing.verify_batch(items, self.e, self.n, workers=2, executor=pool), expected)
+
+
+class TestSharedPool(unittest.TestCase):
+    def setUp(self):
+        self.e, self.d, self.n, self.crt = cached_keygen(64, seed=1)
+
+        self.block_size = 8
+
+        rsa_core.validate_block_size(self.block_size, self.n)
+
+        self.blocks = rsa_core.string_to_blocks("Shared memory hand-off between worker processes. " * 4, self.block_size)
+
+    def test_ecb_matches_sequential(self):
+        print("\n--- Testing Shared Memory ECB ---")
+        encrypted = shared_pool.ecb_encrypt(self.blocks, self.e, self.n, workers=2, chunk_size=5)
+        self.assertEqual(encrypted, ecb.rsa_ecb_encrypt(self.blocks, self.e, self.n))
+
+        decrypted = shared_pool.ecb_decrypt(encrypted, self.d, self.n, self.crt, workers=2, chunk_size=5)
+        self.assertEqual(decrypted, self.blocks)
+
+    def test_cbc_decrypt_matches_sequential(self):
+        print("\n--- Testing Shared Memory CBC Decryption ---")
+        iv = cbc.generate_iv(self.block_size)
+        encrypted = cbc.rsa_cbc_encrypt(self.blocks, self.e, self.n, iv, self.block_size)
+
+        decrypted = shared_pool.cbc_decrypt(encrypted, self.d, self.n, iv, self.block_size, workers=2, chunk_size=3)
+        self.assertEqual(decrypted, self.blocks)
+
+    @unittest.skipUnless(os.path.isdir("/dev/shm"), "needs /dev/shm to list segments")
+    def test_segments_cleaned_up_on_error(self):
+        print("\n--- Testing Shared Memory Cleanup ---")
+        before = set(os.listdir("/dev/shm"))
+
+        # 0 has no inverse, so the worker raises
+        with self.assertRaises(ValueError):
+            shared_pool.ecb_decrypt([5, 0, 7], -1, self.n, workers=2, chunk_size=1)
+
+        self.assertEqual(set(os.listdir("/dev/shm")), before)
+
+    def test_shared_executor(self):
+        print("\n--- Testing Shared Memory With A Long-Lived Pool ---")
+        iv = cbc.generate_iv(self.block_size)
+        cbc_encrypted = cbc.rsa_cbc_encrypt(self.blocks, self.e, self.n, iv, self.block_size)
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            encrypted = shared_pool.ecb_encrypt(self.blocks, self.e, self.n, chunk_size=5, executor=pool)
+            self.assertEqual(shared_pool.ecb_decrypt(encrypted, self.d, self.n, self.crt, executor=pool), self.blocks)
+            self.assertEqual(shared_pool.cbc_decrypt(cbc_encrypted, self.d, self.n, iv, self.block_size, executor=pool),
+                             self.blocks)
+
+            # a failed run leaves the pool usable
+            with self.assertRaises(ValueError):
+                shared_pool.ecb_decrypt([5, 0, 7], -1, self.n, chunk_size=1, executor=pool)
+            self.assertEqual(shared_pool.ecb_encrypt(self.blocks, self.e, self.n, executor=pool), encrypted)
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        self.e, self.d, self.n, _ = cached_keygen(64, seed=1)
+
+        self.block_size = 8
+
+        rsa_core.validate_block_size(self.block_size, self.n)
+
+        self.payload = '{"level": "info", "msg": "request served", "status": 200}\n' * 20
+
+    def test_compression_reduces_blocks(self):
+        print("\n--- Testing Compression Block Count ---")
+        plain = rsa_core.string_to_blocks(self.payload, self.block_size)
+        for method in rsa_core.COMPRESSION_FLAGS:
+            with self.subTest(method=method):
+                compressed = rsa_core.string_to_blocks(self.payload, self.block_size, method)
+                self.assertLess(len(compressed) * 5, len(plain))
+
+    def test_ecb_compressed(self):
+        print("\n--- Testing ECB Mode With Compression ---")
+        for method in rsa_core.COMPRESSION_FLAGS:
+            with self.subTest(method=method):
+                encrypted_blocks = ecb.encrypt_text(self.payload, self.e, self.n, self.block_size, method)
+                decrypted_text = ecb.decrypt_text(encrypted_blocks, self.d, self.n, self.block_size)
+                self.assertEqual(self.payload, decrypted_text)
+
+    def test_cbc_compressed(self):
+        print("\n--- Testing CBC Mode With Compression ---")
+        iv, encrypted_blocks = cbc.encrypt_text(self.payload, self.e, self.n, self.block_size, "zlib")
+        decrypted_text = cbc.decrypt_text(encrypted_blocks, self.d, self.n, iv, self.block_size)
+
+        self.assertEqual(self.payload, decrypted_text)
+
+    def test_flags_not_utf8(self):
+        print("\n--- Testing Compression Flags ---")
+        # a compressed message can be told apart from plain text when decrypting
+        for flag in rsa_core.COMPRESSION_FLAGS.values():
+            with self.assertRaises(UnicodeDecodeError):
+                bytes([flag]).decode("utf-8")
+
+    def test_incompressible_stored(self):
+        print("\n--- Testing Compression Skipped ---")
+        message = "short, zażółć".encode("utf-8")
+        packed = rsa_core.compress_message(message, "zlib")
+
+        self.assertEqual(packed, message)
+        self.assertEqual(rsa_core.decompress_message(packed), message)
+
+        # zlib saves one byte here, which the flag byte takes up again
+        self.assertEqual(len(zlib.compress(b"a" * 12)), 11)
+        self.assertEqual(rsa_core.compress_message(b"a" * 12, "zlib"), b"a" * 12)
+
+    def test_no_block_saved(self):
+        print("\n--- Testing Compression Block Gain ---")
+        # 14 bytes -> 13 bytes with the flag byte, both padded to 2 blocks of 8 bytes
+        message = b"ab" * 7
+        packed = rsa_core.compress_message(message, "zlib")
+        self.assertEqual(packed, bytes([rsa_core.COMPRESSION_FLAGS["zlib"]]) + zlib.compress(message))
+        self.assertEqual(rsa_core.compress_message(message, "zlib", block_size=8), message)
+        self.assertEqual(rsa_core.string_to_blocks("ab" * 7, 8, "zlib"), rsa_core.string_to_blocks("ab" * 7, 8))
+
+        encrypted_blocks = ecb.encrypt_text("short", self.e, self.n, self.block_size, "zlib")
+        self.assertEqual(ecb.decrypt_text(encrypted_blocks, self.d, self.n, self.block_size), "short")
+
+    def test_unknown_method(self):
+        print("\n--- Testing Unknown Compression Method ---")
+        with self.assertRaises(ValueError):
+            rsa_core.compress_message(b"data", "gzip")
+
+
+class TestVectorisedEngine(unittest.TestCase):
+    def setUp(self):
+        if ecb.vectorised_engine(REF_N) is None:
+            self.skipTest("NumPy is not installed")
+
+        import vectorised
+        self.engine = vectorised
+
+    def test_matches_pow(self):
+        print("\n--- Testing Vectorised Modexp ---")
+        blocks = list(range(REF_N))
+
+        self.assertEqual(self.engine.modexp_blocks(blocks, REF_E, REF_N), [pow(m, REF_E, REF_N) for m in blocks])
+        self.assertEqual(self.engine.modexp_blocks(blocks, REF_D, REF_N), [pow(m, REF_D, REF_N) for m in blocks])
+
+    def test_reference_vectors(self):
+        print("\n--- Testing Vectorised Reference Vectors ---")
+        plaintexts = [m for m, _ in REFERENCE_TEST_VECTORS]
+        expected = [c for _, c in REFERENCE_TEST_VECTORS]
+
+        self.assertEqual(ecb.rsa_ecb_encrypt(plaintexts, REF_E, REF_N), expected)
+        self.assertEqual(ecb.rsa_ecb_decrypt(expected, REF_D, REF_N), plaintexts)
+
+    def test_largest_modulus(self):
+        print("\n--- Testing Vectorised Modexp Near 2^32 ---")
+        n = 4294967291  # largest prime below 2^32
+        blocks = [0, 1, 2, n - 2, n - 1, 123456789]
+
+        self.assertEqual(self.engine.modexp_blocks(blocks, 65537, n), [pow(m, 65537, n) for m in blocks])
+
+    def test_ecb_text_small_modulus(self):
+        print("\n--- Testing ECB Text With Small Modulus ---")
+        text = "Classroom-scale RSA."
+
+        encrypted_blocks = ecb.encrypt_text(text, REF_E, REF_N, 1)
+        self.assertEqual(ecb.decrypt_text(encrypted_blocks, REF_D, REF_N, 1), text)
+
+    def test_block_too_large(self):
+        print("\n--- Testing Vectorised Block Validation ---")
+        with self.assertRaises(ValueError):
+            ecb.rsa_ecb_encrypt([65, REF_N], REF_E, REF_N)
+
+
+class TestDistributed(unittest.TestCase):
+    AUTHKEY = b"rsa-test-workers"
+
+    def setUp(self):
+        self.e, self.d, self.n, self.crt = cached_keygen(64, seed=1)
+
+        self.block_size = 8
+
+        rsa_core.validate_block_size(self.block_size, self.n)
+
+        self.blocks = rsa_core.string_to_blocks("Sharded across several workers on localhost. " * 10, self.block_size)
+        self.processes = []
+
+    def tearDown(self):
+        for process in self.processes:
+            process.terminate()
+            process.join()
+
+    def start_workers(self, count: int, delay: float = 0.0) -> list[tuple[str, int]]:
+        workers = distributed.start_local_workers(count, self.AUTHKEY, delay)
+        self.processes.extend(process for process, _ in workers)
+        return [address for _, address in workers]
+
+    def test_ecb_roundtrip(self):
+        print("\n--- Testing Sharded ECB ---")
+        addresses = self.start_workers(3)
+
+        encrypted = distributed.ecb_encrypt(addresses, self.blocks, self.e, self.n, self.AUTHKEY, shard_size=4)
+        self.assertEqual(encrypted, ecb.rsa_ecb_encrypt(self.blocks, self.e, self.n))
+
+        decrypted = distributed.ecb_decrypt(addresses, encrypted, self.d, self.n, self.AUTHKEY, self.crt, shard_size=7)
+        self.assertEqual(decrypted, self.blocks)
+
+    def test_cbc_decrypt(self):
+        print("\n--- Testing Sharded CBC Decryption ---")
+        addresses = self.start_workers(3)
+        iv = cbc.generate_iv(self.block_size)
+        encrypted = cbc.rsa_cbc_encrypt(self.blocks, self.e, self.n, iv, self.block_size)
+
+        decrypted = distributed.cbc_decrypt(addresses, encrypted, self.d, self.n, iv, self.block_size, self.AUTHKEY, shard_size=5)
+        self.assertEqual(decrypted, self.blocks)
+
+    def test_unreachable_worker(self):
+        print("\n--- Testing Unreachable Worker ---")
+        addresses = self.start_workers(2)
+        self.processes[0].terminate()
+        self.processes[0].join()
+
+        encrypted = distributed.ecb_encrypt(addresses, self.blocks, self.e, self.n, self.AUTHKEY, shard_size=4)
+        self.assertEqual(encrypted, ecb.rsa_ecb_encrypt(self.blocks, self.e, self.n))
+
+    def test_worker_dies_mid_run(self):
+        print("\n--- Testing Worker Dying Mid-Run ---")
+        addresses = self.start_workers(1, delay=1.0) + self.start_workers(1)
+        threading.Timer(0.3, self.processes[0].terminate).start()
+
+        encrypted = distributed.ecb_encrypt(addresses, self.blocks, self.e, self.n, self.AUTHKEY,
+                                            shard_size=4, straggler_timeout=None)
+        self.assertEqual(encrypted, ecb.rsa_ecb_encrypt(self.blocks, self.e, self.n))
+
+    def test_slow_worker_rebalanced(self):
+        print("\n--- Testing Slow Worker Rebalancing ---")
+        addresses = self.start_workers(1, delay=5.0) + self.start_workers(1)
+
+        started = time.monotonic()
+        encrypted = distributed.ecb_encrypt(addresses, self.blocks, self.e, self.n, self.AUTHKEY,
+                                            shard_size=4, straggler_timeout=0.2)
+        self.assertLess(time.monotonic() - started, 3.0)
+        self.assertEqual(encrypted, ecb.rsa_ecb_encrypt(self.blocks, self.e, self.n))
+
+    def test_busy_worker_does_not_block(self):
+        print("\n--- Testing Worker Busy With An Earlier Run ---")
+        addresses = self.start_workers(1, delay=4.0) + self.start_workers(1)
+
+        # the slow worker is still busy with a shard of the first run when the second one starts
+        for _ in range(2):
+            started = time.monotonic()
+            encrypted = distributed.ecb_encrypt(addresses, self.blocks, self.e, self.n, self.AUTHKEY,
+                                                shard_size=4, straggler_timeout=0.2)
+            self.assertLess(time.monotonic() - started, 2.0)
+            self.assertEqual(encrypted, ecb.rsa_ecb_encrypt(self.blocks, self.e, self.n))
+
+    def test_hung_worker_timeout(self):
+        print("\n--- Testing Hung Workers ---")
+        # one worker never returns its shard, one never accepts the connection
+        addresses = self.start_workers(1, delay=60.0) + self.start_workers(1)
+        with socket.create_server(("localhost", 0)) as never_accepts:
+            addresses.append(never_accepts.getsockname()[:2])
+
+            started = time.monotonic()
+            encrypted = distributed.ecb_encrypt(addresses, self.blocks, self.e, self.n, self.AUTHKEY,
+                                                shard_size=4, straggler_timeout=None, worker_timeout=0.5)
+            self.assertLess(time.monotonic() - started, 5.0)
+            self.assertEqual(encrypted, ecb.rsa_ecb_encrypt(self.blocks, self.e, self.n))
+
+    def test_coordinator_dies_mid_shard(self):
+        print("\n--- Testing Coordinator Dying Mid-Shard ---")
+        addresses = self.start_workers(1)
+
+        # a coordinator that sends a shard and exits without reading the reply,
+        # closing a socket with unread data resets the connection
+        conn = Client(addresses[0], authkey=self.AUTHKEY)
+        conn.send(("key", self.e, self.n, None, None))
+        conn.recv()
+        conn.send(("shard", 0, self.blocks[:4], None))
+        time.sleep(0.3)
+        conn.close()
+        time.sleep(0.3)
+
+        self.assertTrue(self.processes[0].is_alive())
+        encrypted = distributed.ecb_encrypt(addresses, self.blocks, self.e, self.n, self.AUTHKEY, shard_size=50)
+        self.assertEqual(encrypted, ecb.rsa_ecb_encrypt(self.blocks, self.e, self.n))
+
+    def test_all_workers_down(self):
+        print("\n--- Testing No Workers ---")
+        addresses = self.start_workers(1)
+        self.processes[0].terminate()
+        self.processes[0].join()
+
+        with self.assertRaises(RuntimeError):
+            distributed.ecb_encrypt(addresses, self.blocks, self.e, self.n, self.AUTHKEY)
+
+
+class TestPaging(unittest.TestCase):
+    def test_only_visible_rows_formatted(self):
+        print("\n--- Testing Block Pager ---")
+        class CountingBlocks(list):
+            accessed = 0
+
+            def __getitem__(self, i):
+                CountingBlocks.accessed += 1
+                return super().__getitem__(i)
+
+        blocks = CountingBlocks(range(300000))
+        pager = paging.BlockPager(page_size=5)
+        pager.set_items(blocks, width=4)
+
+        self.assertEqual(pager.visible_rows(), ["[0] 0", "[1] 1", "[2] 2", "[3] 3", "[4] 4"])
+        self.assertEqual(CountingBlocks.accessed, 5)
+
+    def test_goto_and_scroll(self):
+        print("\n--- Testing Block Pager Navigation ---")
+        pager = paging.BlockPager(page_size=10)
+        pager.set_items(list(range(100)))
+
+        pager.goto(42)
+        self.assertEqual(pager.visible_rows()[0], "[42] 42")
+
+        pager.goto(1000)
+        self.assertEqual(pager.first, 90)
+
+        pager.scroll(-95)
+        self.assertEqual(pager.first, 0)
+
+        pager.moveto(0.5)
+        self.assertEqual(pager.first, 50)
+        self.assertEqual(pager.fractions(), (0.5, 0.6))
+
+    def test_hex_format(self):
+        print("\n--- Testing Hex Block Format ---")
+        pager = paging.BlockPager(page_size=2)
+        pager.set_items([255, 4096], width=2)
+        pager.fmt = "hex"
+
+        self.assertEqual(pager.visible_rows(), ["[0] 00ff", "[1] 1000"])
+
+    def test_text_chunks(self):
+        print("\n--- Testing Plaintext Chunks ---")
+        chunks = paging.TextChunks("abcdefg\nhij", chunk_size=4)
+
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(list(chunks), ["abcd", "efg\n", "hij"])
+
+        pager = paging.BlockPager(page_size=3)
+        pager.set_items(chunks)
+        self.assertEqual(pager.visible_rows()[1], "[1] efg\\n")
+
+
+class TestBroadcast(unittest.TestCase):
+    def setUp(self):
+        # moduli of different sizes, so the recipients need different block sizes
+        self.keys = [cached_keygen(bits, seed)[:3] for bits, seed in ((64, 1), (64, 2), (80, 1), (96, 1))]
+        self.recipients = [(e, n) for e, _, n in self.keys]
+        self.text = "Broadcast to every recipient at once."
+
+    def test_ecb_recipients(self):
+        print("\n--- Testing Multi-Recipient ECB ---")
+        ciphertexts = broadcast.encrypt_for_recipients(self.text, self.recipients, workers=2)
+
+        self.assertEqual(len(ciphertexts), len(self.keys))
+        for (e, d, n), encrypted_blocks in zip(self.keys, ciphertexts):
+            block_size = broadcast.default_block_size(n)
+            self.assertEqual(encrypted_blocks, ecb.encrypt_text(self.text, e, n, block_size))
+            self.assertEqual(ecb.decrypt_text(encrypted_blocks, d, n, block_size), self.text)
+
+    def test_cbc_recipients(self):
+        print("\n--- Testing Multi-Recipient CBC ---")
+        ciphertexts = broadcast.encrypt_for_recipients(self.text, self.recipients, "CBC", block_size=7,
+                                                       compression="zlib", workers=2)
+
+        for (e, d, n), (iv, encrypted_blocks) in zip(self.keys, ciphertexts):
+            self.assertEqual(cbc.decrypt_text(encrypted_blocks, d, n, iv, 7), self.text)
+
+    def test_seeded_cbc(self):
+        print("\n--- Testing Multi-Recipient Seeded CBC ---")
+        first = broadcast.encrypt_for_recipients(self.text, self.recipients, "CBC", block_size=7, workers=1,
+                                                 rng=random.Random(7))
+        second = broadcast.encrypt_for_recipients(self.text, self.recipients, "CBC", block_size=7, workers=2,
+                                                  rng=random.Random(7))
+        self.assertEqual(first, second)
+
+        # same IV as cbc.encrypt_text() with the same seed
+        e, n = self.recipients[0]
+        self.assertEqual(first[0], cbc.encrypt_text(self.text, e, n, 7, rng=random.Random(7)))
+
+    def test_in_process(self):
+        print("\n--- Testing Multi-Recipient In-Process ---")
+        self.assertEqual(broadcast.encrypt_for_recipients(self.text, self.recipients, workers=1),
+                         broadcast.encrypt_for_recipients(self.text, self.recipients, workers=2))
+
+    def test_large_modulus(self):
+        print("\n--- Testing Multi-Recipient Large Modulus ---")
+        # 4096 bit modulus, the largest valid block size would not fit the one byte padding length
+        e, d, n, _ = cached_keygen(2048, seed=1)
+        block_size = broadcast.default_block_size(n)
+        self.assertEqual(block_size, 255)
+
+        ciphertexts = broadcast.encrypt_for_recipients(self.text, self.recipients[:1] + [(e, n)], workers=1)
+        self.assertEqual(ecb.decrypt_text(ciphertexts[1], d, n, block_size), self.text)
+
+    def test_block_size_too_large(self):
+        print("\n--- Testing Multi-Recipient Block Size Validation ---")
+        with self.assertRaises(ValueError):
+            broadcast.encrypt_for_recipients(self.text, self.recipients, block_size=16)
+
+
+class TestTransportEncoding(unittest.TestCase):
+    def setUp(self):
+        self.e, self.d, self.n, _ = cached_keygen(64, seed=1)
+
+        self.block_size = 8
+
+        rsa_core.validate_block_size(self.block_size, self.n)
+
+    def test_ecb_roundtrip(self):
+        print("\n--- Testing Transport Encoding (ECB) ---")
+        text = "Copy, log and pipe me."
+        encrypted_blocks = ecb.encrypt_text(text, self.e, self.n, self.block_size)
+
+        for encoding in transport.ENCODINGS:
+            with self.subTest(encoding=encoding):
+                encoded = transport.encode(encrypted_blocks, self.n, "ECB", self.block_size, encoding=encoding)
+                decoded = transport.decode(encoded)
+
+                self.assertTrue(encoded.startswith(f"RSA1.{encoding}."))
+                self.assertEqual(decoded["mode"], "ECB")
+                self.assertIsNone(decoded["iv"])
+                self.assertEqual(decoded["ciphertext"], encrypted_blocks)
+                self.assertEqual(ecb.decrypt_text(decoded["ciphertext"], self.d, self.n, decoded["block_size"]), text)
+
+    def test_cbc_roundtrip(self):
+        print("\n--- Testing Transport Encoding (CBC) ---")
+        text = '{"event": "login", "user": "alice"}' * 5
+        iv, encrypted_blocks = cbc.encrypt_text(text, self.e, self.n, self.block_size, "zlib")
+
+        decoded = transport.decode(transport.encode(encrypted_blocks, self.n, "CBC", self.block_size, iv))
+
+        self.assertEqual(decoded["iv"], iv)
+        self.assertEqual(cbc.decrypt_text(decoded["ciphertext"], self.d, self.n, decoded["iv"], decoded["block_size"]), text)
+
+    def test_smaller_than_decimal(self):
+        print("\n--- Testing Transport Encoding Size ---")
+        encrypted_blocks = ecb.encrypt_text("x" * 400, self.e, self.n, self.block_size)
+
+        self.assertLess(len(transport.encode(encrypted_blocks, self.n, "ECB", self.block_size)), len(str(encrypted_blocks)) * 0.6)
+
+    def test_invalid_input(self):
+        print("\n--- Testing Transport Encoding Errors ---")
+        with self.assertRaises(ValueError):
+            transport.decode("not a ciphertext")
+        with self.assertRaises(ValueError):
+            transport.encode([1, 2], self.n, "CBC", self.block_size)
+
+        encoded = transport.encode([1, 2], self.n, "ECB", self.block_size, encoding="hex")
+        with self.assertRaises(ValueError):
+            transport.decode(encoded[:-2])
+
+
+class TestStartupTime(unittest.TestCase):
+    # modules used by short-lived CLI runs, and what they must not load up front
+    MODULES = ["rsa_core", "ecb", "cbc", "transport", "consolemode", "main"]
+    HEAVY_MODULES = ["Crypto", "tkinter", "numpy"]
+    # measured with cached bytecode: ~5 ms for all modules, ~1 ms for rsa_core (~20 ms with pycryptodome imported eagerly)
+    IMPORT_TIME_BUDGET_US = 12000
+    MODULE_BUDGETS_US = {"rsa_core": 4000}
+
+    @classmethod
+    def setUpClass(cls):
+        # bytecode goes to a temporary directory, so the runs measure importing, not compiling,
+        # even where writing __pycache__ is disabled (PYTHONDONTWRITEBYTECODE) or not possible
+        cls.pycache = tempfile.TemporaryDirectory()
+        cls.env = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+        cls.import_times(cls)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pycache.cleanup()
+
+    def import_times(self) -> dict[str, int]:
+        # -X importtime reports "import time: self [us] | cumulative | name" on stderr
+        result = subprocess.run([sys.executable, "-X", "importtime", "-X", f"pycache_prefix={self.pycache.name}",
+                                 "-c", "import " + ", ".join(self.MODULES)], env=self.env,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True)
+        times = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            times[name.strip()] = int(cumulative)
+        return times
+
+    def test_heavy_modules_lazy(self):
+        print("\n--- Testing Lazy Imports ---")
+        times = self.import_times()
+        for heavy in self.HEAVY_MODULES:
+            with self.subTest(module=heavy):
+                self.assertNotIn(heavy, times, f"{heavy} should only be imported when first needed")
+
+    def test_import_time_budget(self):
+        print("\n--- Testing Import Time Budget ---")
+        # best of a few runs, to keep scheduling noise out
+        runs = [self.import_times() for _ in range(3)]
+
+        total = min(sum(times[module] for module in self.MODULES) for times in runs)
+        print(f"Import time: {total} us (budget {self.IMPORT_TIME_BUDGET_US} us)")
+        self.assertLess(total, self.IMPORT_TIME_BUDGET_US)
+
+        for module, budget in self.MODULE_BUDGETS_US.items():
+            with self.subTest(module=module):
+                self.assertLess(min(times[module] for times in runs), budget)
+
+
+class TestSeededKeys(unittest.TestCase):
+    def test_seeded_keygen_reproducible(self):
+        print("\n--- Testing Seeded Keygen ---")
+        first = rsa_core.keygen_crt(64, rng=random.Random(42))
+        second = rsa_core.keygen_crt(64, rng=random.Random(42))
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, rsa_core.keygen_crt(64, rng=random.Random(43)))
+
+    def test_seeded_iv_reproducible(self):
+        print("\n--- Testing Seeded IV ---")
+        e, d, n, _ = cached_keygen(64, seed=1)
+        text = "Same seed, same ciphertext."
+
+        first = cbc.encrypt_text(text, e, n, 8, rng=random.Random(7))
+        second = cbc.encrypt_text(text, e, n, 8, rng=random.Random(7))
+
+        self.assertEqual(first, second)
+        self.assertEqual(cbc.decrypt_text(first[1], d, n, first[0], 8), text)
+
+    def test_cached_keys_match_seeded_keygen(self):
+        print("\n--- Testing Key Fixture Cache ---")
+        self.assertEqual(cached_keygen(64, seed=1), rsa_core.keygen_crt(64, rng=random.Random(1)))
+
+
+class TestLargeKeys(unittest.TestCase):
+    # prime sizes for 1024, 2048 and 4096 bit moduli, generated once and then read from the key cache
+    PRIME_BITS = [512, 1024, 2048]
+
+    def test_ecb_cbc_large_keys(self):
+        print("\n--- Testing Large Keys ---")
+        text = "Larger-key test matrix."
+        for bits in self.PRIME_BITS:
+            with self.subTest(modulus_bits=2 * bits):
+                e, d, n, crt = cached_keygen(bits, seed=1)
+                # largest valid block size, at most 255 bytes as the padding length is stored in one byte
+                block_size = min((n.bit_length() - 1) // 8, 255)
+
+                encrypted_blocks = ecb.encrypt_text(text, e, n, block_size)
+                self.assertEqual(ecb.decrypt_text(encrypted_blocks, d, n, block_size, crt), text)
+
+                iv, encrypted_blocks = cbc.encrypt_text(text, e, n, block_size)
+                self.assertEqual(cbc.decrypt_text(encrypted_blocks, d, n, iv, block_size, crt), text)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
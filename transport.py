@@ -0,0 +1,116 @@
+import binascii
+import struct
+import rsa_core
+
+# Compact text encoding of a ciphertext, for copying, logging and piping.
+# The blocks are written as fixed-width big-endian records (see rsa_core.record_width()) behind a small header,
+# and the whole thing is encoded in one pass. Format: "RSA1.<encoding>.<encoded data>"
+#
+# header: mode (1 byte), block size (2 bytes), record width (2 bytes), IV (block size bytes, CBC only)
+# Compression does not need a flag here, the decrypted message records it (see rsa_core.compress_message()).
+
+PREFIX = "RSA1"
+MODES = {"ECB": 0, "CBC": 1}
+HEADER = struct.Struct(">BHH")
+
+ENCODINGS = ("base64", "base85", "hex")
+
+def _to_text(data: bytes, encoding: str) -> str:
+    if encoding == "base64":
+        return binascii.b2a_base64(data, newline=False).decode("ascii")
+    if encoding == "hex":
+        return data.hex()
+
+    # base85 is only in the base64 module, which is slow to import (it pulls in re)
+    import base64
+    return base64.b85encode(data).decode("ascii")
+
+
+def _from_text(text: str, encoding: str) -> bytes:
+    if encoding == "base64":
+        return binascii.a2b_base64(text)
+    if encoding == "hex":
+        return bytes.fromhex(text)
+
+    import base64
+    return base64.b85decode(text)
+
+
+def encode(encrypted_blocks: list[int], n: int, mode: str, block_size: int, iv: int | None = None,
+           encoding: str = "base64") -> str:
+    """
+    Encodes a ciphertext (and what is needed to decrypt it, except the key) as text.
+
+    :param encrypted_blocks: Encrypted blocks.
+    :type encrypted_blocks: list[int]
+    :param n: RSA modulus.
+    :type n: int
+    :param mode: "ECB" or "CBC".
+    :type mode: str
+    :param block_size: Size of blocks (in bytes).
+    :type block_size: int
+    :param iv: Initialisation vector, CBC only.
+    :type iv: int | None
+    :param encoding: "base64", "base85" or "hex".
+    :type encoding: str
+    :return: Encoded ciphertext.
+    :rtype: str
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode}")
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unknown encoding: {encoding}")
+    if (mode == "CBC") != (iv is not None):
+        raise ValueError("An IV is required for CBC mode (and only for CBC mode)")
+
+    width = rsa_core.record_width(n)
+    data = HEADER.pack(MODES[mode], block_size, width)
+    if iv is not None:
+        data += (iv & ((1 << (block_size * 8)) - 1)).to_bytes(block_size, byteorder="big")
+    data += b"".join(block.to_bytes(width, byteorder="big") for block in encrypted_blocks)
+
+    return f"{PREFIX}.{encoding}.{_to_text(data, encoding)}"
+
+
+def decode(text: str) -> dict:
+    """
+    Parses a ciphertext encoded with encode().
+
+    :param text: Encoded ciphertext.
+    :type text: str
+    :return: "mode", "block_size", "iv" (None for ECB) and "ciphertext" (encrypted blocks).
+    :rtype: dict
+    """
+    try:
+        prefix, encoding, encoded = text.strip().split(".", 2)
+    except ValueError:
+        raise ValueError("Not an encoded ciphertext") from None
+    if prefix != PREFIX or encoding not in ENCODINGS:
+        raise ValueError("Not an encoded ciphertext")
+
+    data = _from_text(encoded, encoding)
+    if len(data) < HEADER.size:
+        raise ValueError("Encoded ciphertext too short")
+
+    mode_id, block_size, width = HEADER.unpack_from(data)
+    modes = {mode_id: mode for mode, mode_id in MODES.items()}
+    if mode_id not in modes or width == 0:
+        raise ValueError("Corrupted ciphertext header")
+
+    offset = HEADER.size
+    iv = None
+    if modes[mode_id] == "CBC":
+        iv = int.from_bytes(data[offset: offset+block_size], byteorder="big")
+        offset += block_size
+
+    if (len(data) - offset) % width != 0:
+        raise ValueError("Encoded ciphertext has a truncated block")
+
+    blocks = [int.from_bytes(data[i: i+width], byteorder="big") for i in range(offset, len(data), width)]
+
+    return {
+        "mode": modes[mode_id],
+        "block_size": block_size,
+        "iv": iv,
+        "ciphertext": blocks,
+    }
@@ -0,0 +1,36 @@
+import numpy as np
+
+# Moduli below 2^32 keep every product of two residues below 2^64,
+# so the whole square-and-multiply can run on uint64 arrays without overflow.
+MAX_MODULUS = 1 << 32
+
+
+def modexp_blocks(blocks: list[int], exponent: int, n: int) -> list[int]:
+    """
+    Computes pow(block, exponent, n) for every block at once (square-and-multiply over a NumPy array).\n
+    Python call overhead dominates for small moduli, this does one array operation per exponent bit instead.
+
+    :param blocks: Blocks (integers) to be raised to the exponent.
+    :type blocks: list[int]
+    :param exponent: Public or private key.
+    :type exponent: int
+    :param n: RSA modulus, must be smaller than 2^32.
+    :type n: int
+    :return: Results, in the same order as blocks.
+    :rtype: list[int]
+    """
+    if not 1 < n < MAX_MODULUS:
+        raise ValueError("Modulus too large for vectorised modular exponentiation")
+    assert exponent >= 0
+
+    modulus = np.uint64(n)
+    base = np.array(blocks, dtype=np.uint64) % modulus
+    result = np.ones_like(base)
+
+    while exponent:
+        if exponent & 1:
+            result = (result * base) % modulus
+        base = (base * base) % modulus
+        exponent >>= 1
+
+    return result.tolist()